@@ -1,10 +0,0 @@
-# FlaskProject/extensions.py - Flask Extensions Initialization
-
-from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from flask_socketio import SocketIO
-
-# Initialize extensions
-db = SQLAlchemy()
-migrate = Migrate()
-socketio = SocketIO()
\ No newline at end of file
@@ -1 +0,0 @@
-# tests/__init__.py - Test Package
\ No newline at end of file
@@ -1 +0,0 @@
-# FlaskProject/utils/__init__.py - Utils Package
\ No newline at end of file
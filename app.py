@@ -1,7 +1,18 @@
 # FlaskProject/app.py - Main Application File
 
-import logging
 import os
+
+# eventlet/gevent must patch the standard library before anything else imports it,
+# so the Socket.IO async mode is read straight from the environment (not from .env)
+SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
+if SOCKETIO_ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif SOCKETIO_ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
+import logging
 from datetime import timedelta
 
 from flask import Flask
@@ -9,6 +20,7 @@ from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_talisman import Talisman
+from sqlalchemy import event
 
 # Import configuration
 from config import get_config
@@ -40,7 +52,8 @@ def create_app(config_name=None):
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
-    socketio.init_app(app, cors_allowed_origins="*", async_mode='threading')
+    socketio.init_app(app, cors_allowed_origins="*", async_mode=SOCKETIO_ASYNC_MODE,
+                      message_queue=app.config.get('SOCKETIO_MESSAGE_QUEUE'))
     
     # Setup CORS
     cors_origins = config.CORS_ORIGINS
@@ -72,17 +85,49 @@ def create_app(config_name=None):
     
     # Create database tables and initialize data
     with app.app_context():
+        if db.engine.dialect.name == 'sqlite' and db.engine.url.database not in (None, '', ':memory:'):
+            event.listen(db.engine, 'connect', set_sqlite_pragmas)
         db.create_all()
         
         # Initialize default achievements
-        from game_logic import initialize_default_achievements
+        from game_logic import initialize_default_achievements, preload_questions
         initialize_default_achievements()
     
+    # Parse the question files now rather than on the first game request
+    preload_questions()
+    
     # Configure session
     app.permanent_session_lifetime = timedelta(seconds=config.PERMANENT_SESSION_LIFETIME)
+    if app.config.get('SESSION_TYPE') == 'redis':
+        init_redis_sessions(app)
     
     return app
 
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so readers don't block the writer, and skip the fsync on every commit."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')  # 256 MB
+    cursor.close()
+
+def init_redis_sessions(app):
+    """Store sessions in Redis so the cookie only carries a session id.
+    
+    Falls back to Flask's signed cookie sessions if Flask-Session or redis is missing.
+    """
+    try:
+        import redis
+        from flask_session import Session
+    except ImportError:
+        app.logger.warning("SESSION_TYPE is 'redis' but Flask-Session/redis are not installed, "
+                           "using cookie sessions")
+        return
+    
+    app.config.setdefault('SESSION_REDIS', redis.from_url(app.config['REDIS_URL']))
+    Session(app)
+
 
 def display_startup_info(config, network_manager=None):
     """Display network information and startup details."""
@@ -117,11 +162,11 @@ def display_startup_info(config, network_manager=None):
         else:
             print(f"   • Dynamic IP monitoring: Disabled")
         
-        # URLs for different purposes
+        # URLs for different purposes (QR codes are generated here so the host lobby finds them cached)
         if network_manager:
-            urls = network_manager.get_network_urls(port=config.FLASK_PORT)
+            urls = network_manager.get_network_urls(port=config.FLASK_PORT, include_qr=True)
         else:
-            urls = get_network_urls(host=local_ip, port=config.FLASK_PORT)
+            urls = get_network_urls(host=local_ip, port=config.FLASK_PORT, include_qr=True)
             
         print(f"\n👥 For classmates/other devices:")
         print(f"   • Main page: {urls['local_url']}")
@@ -4,21 +4,47 @@ import os
 import secrets
 from pathlib import Path
 
+from sqlalchemy.pool import StaticPool
+
 # Base directory
 BASE_DIR = Path(__file__).parent
 
 def load_env_file():
-    """Load environment variables from .env file if it exists."""
+    """Load environment variables from .env file if it exists.
+    
+    Uses python-dotenv when installed. Variables already in the environment are kept.
+    """
     env_file = BASE_DIR / '.env'
-    if env_file.exists():
-        with open(env_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    # Only set if not already in environment
-                    if key not in os.environ:
-                        os.environ[key] = value
+    if not env_file.exists():
+        return
+    
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        _parse_env_file(env_file)
+    else:
+        load_dotenv(env_file, override=False)
+
+def _parse_env_file(env_file):
+    """Minimal .env parser: handles `export`, quoted values and trailing comments."""
+    with open(env_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('export '):
+                line = line[len('export '):].lstrip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            
+            key, value = line.split('=', 1)
+            key, value = key.strip(), value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                value = value[1:-1]
+            elif ' #' in value:
+                value = value.split(' #', 1)[0].rstrip()
+            
+            # Only set if not already in environment
+            if key not in os.environ:
+                os.environ[key] = value
 
 # Load .env file if it exists
 load_env_file()
@@ -41,6 +67,21 @@ class Config:
     
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection pool - sized for Socket.IO threads; pre-ping only matters for networked databases
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 3600)),
+        'pool_pre_ping': os.environ.get(
+            'DB_POOL_PRE_PING', str(not SQLALCHEMY_DATABASE_URI.startswith('sqlite'))
+        ).lower() == 'true',
+    }
+    # Queue pool sizing; SQLite URLs such as sqlite:///:memory: get pools that reject these
+    if not SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 5)),
+            'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        })
+    
     # Security settings
     SESSION_COOKIE_SECURE = os.environ.get('SESSION_COOKIE_SECURE', 'False').lower() == 'true'
     SESSION_COOKIE_HTTPONLY = os.environ.get('SESSION_COOKIE_HTTPONLY', 'True').lower() == 'true'
@@ -50,7 +91,12 @@ class Config:
     # Rate limiting
     RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', 'True').lower() == 'true'
     RATELIMIT_DEFAULT = os.environ.get('RATELIMIT_DEFAULT', '100 per hour')
-    RATELIMIT_STORAGE_URL = os.environ.get('RATELIMIT_STORAGE_URL', 'memory://')
+    # memory:// keeps separate counters per worker process; with REDIS_URL set the
+    # limits are shared by all workers
+    REDIS_URL = os.environ.get('REDIS_URL')
+    RATELIMIT_STORAGE_URL = os.environ.get('RATELIMIT_STORAGE_URL', REDIS_URL or 'memory://')
+    # Socket.IO message queue; needed when several workers broadcast to the same rooms
+    SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE', REDIS_URL)
     
     # CORS - Allow all origins for easy device access (minimal security)
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*')
@@ -85,8 +131,14 @@ class TestingConfig(Config):
     TESTING = True
     WTF_CSRF_ENABLED = False
     RATELIMIT_ENABLED = False
+    SOCKETIO_MESSAGE_QUEUE = None
     # Use in-memory SQLite for testing
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # Keep a single shared connection so the in-memory database survives across sessions
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
     
 class ProductionConfig(Config):
     """Production configuration."""
@@ -97,9 +149,9 @@ class ProductionConfig(Config):
     # Enhanced security for production
     RATELIMIT_DEFAULT = '50 per hour'
     
-    # Use Redis for rate limiting in production if available
-    if os.environ.get('REDIS_URL'):
-        RATELIMIT_STORAGE_URL = os.environ.get('REDIS_URL')
+    # Server-side sessions share the rate limiter's Redis instance
+    if Config.REDIS_URL:
+        SESSION_TYPE = 'redis'
 
 # Configuration mapping
 config_map = {
@@ -1,7 +1,7 @@
 # FlaskProject/database.py - Database Models
 
-from datetime import datetime, timezone
 from sqlalchemy import JSON
+from sqlalchemy.sql import func
 from extensions import db
 
 class Game(db.Model):
@@ -13,10 +13,10 @@ class Game(db.Model):
     state = db.Column(db.String(20), default='waiting')  # waiting, playing, finished
     current_question = db.Column(db.Integer, default=0)
     questions = db.Column(JSON)  # Store questions as JSON
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
-    players = db.relationship('Player', backref='game', lazy='dynamic', cascade='all, delete-orphan')
+    players = db.relationship('Player', backref='game', cascade='all, delete-orphan')
     
     def __repr__(self):
         return f'<Game {self.pin}: {self.host_name}>'
@@ -24,17 +24,43 @@ class Game(db.Model):
 class Player(db.Model):
     """Player model for storing player information."""
     __tablename__ = 'players'
+    __table_args__ = (
+        # Serves both game.players lookups and leaderboard sorting by score
+        db.Index('ix_players_game_pin_score', 'game_pin', 'score'),
+        # Player names are unique per game; add_player_to_game relies on this
+        db.Index('ix_players_game_pin_name', 'game_pin', 'name', unique=True),
+    )
     
     id = db.Column(db.String(36), primary_key=True)  # UUID
     name = db.Column(db.String(50), nullable=False)
     game_pin = db.Column(db.String(6), db.ForeignKey('games.pin'), nullable=False)
     score = db.Column(db.Integer, default=0)
-    answers = db.Column(JSON, default=list)  # Store player answers
-    joined_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    joined_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
+    
+    # Relationships
+    answers = db.relationship('PlayerAnswer', backref='player', cascade='all, delete-orphan',
+                              order_by='PlayerAnswer.question_index')
     
     def __repr__(self):
         return f'<Player {self.name} in game {self.game_pin}>'
 
+class PlayerAnswer(db.Model):
+    """A player's answer to one question of a multiplayer game."""
+    __tablename__ = 'player_answers'
+    __table_args__ = (
+        # One answer per player and question; submit_answer relies on this
+        db.PrimaryKeyConstraint('player_id', 'question_index'),
+    )
+    
+    player_id = db.Column(db.String(36), db.ForeignKey('players.id'), nullable=False)
+    question_index = db.Column(db.Integer, nullable=False)
+    answer = db.Column(db.Text, nullable=False)
+    response_time = db.Column(db.Float, nullable=True)
+    submitted_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f'<PlayerAnswer {self.player_id} #{self.question_index}: {self.answer}>'
+
 class PlayerStats(db.Model):
     """Enhanced statistics for solo quiz games."""
     __tablename__ = 'player_stats'
@@ -48,7 +74,7 @@ class PlayerStats(db.Model):
     language = db.Column(db.String(2), nullable=True)     # Track language used
     avg_response_time = db.Column(db.Float, nullable=True) # Average response time
     streak = db.Column(db.Integer, default=0)             # Correct answer streak
-    played_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    played_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
     
     def __repr__(self):
         return f'<PlayerStats {self.player_name}: {self.score}/{self.total_questions}>'
@@ -60,10 +86,10 @@ class QuizSet(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     author = db.Column(db.String(50), nullable=False)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
-    questions = db.relationship('CustomQuestion', backref='quiz_set', lazy='dynamic', cascade='all, delete-orphan')
+    questions = db.relationship('CustomQuestion', back_populates='quiz_set', cascade='all, delete-orphan')
     
     def __repr__(self):
         return f'<QuizSet {self.name} by {self.author}>'
@@ -82,7 +108,10 @@ class CustomQuestion(db.Model):
     image_url = db.Column(db.String(255), nullable=True)     # For image questions
     timer_seconds = db.Column(db.Integer, default=30)       # Question timer
     points = db.Column(db.Integer, default=100)             # Base points for question
-    quiz_set_id = db.Column(db.Integer, db.ForeignKey('quiz_sets.id'), nullable=False)
+    quiz_set_id = db.Column(db.Integer, db.ForeignKey('quiz_sets.id'), nullable=False, index=True)
+    
+    # Relationships
+    quiz_set = db.relationship('QuizSet', back_populates='questions')
     
     def __repr__(self):
         return f'<CustomQuestion {self.question[:30]}...>'
@@ -106,8 +135,8 @@ class User(db.Model):
     best_streak = db.Column(db.Integer, default=0)
     preferred_language = db.Column(db.String(2), default='de')
     theme_preference = db.Column(db.String(10), default='dark') # dark, light
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
-    last_active = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
+    last_active = db.Column(db.DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     achievements = db.relationship('UserAchievement', backref='user', lazy='dynamic')
@@ -129,7 +158,7 @@ class Achievement(db.Model):
     points = db.Column(db.Integer, default=10)              # Achievement points
     rarity = db.Column(db.String(10), default='common')     # common, rare, epic, legendary
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
     
     def __repr__(self):
         return f'<Achievement {self.name}>'
@@ -141,7 +170,7 @@ class UserAchievement(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     achievement_id = db.Column(db.Integer, db.ForeignKey('achievements.id'), nullable=False)
-    unlocked_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    unlocked_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
     progress = db.Column(db.Integer, default=0)             # Current progress towards achievement
     
     # Relationships
@@ -4,7 +4,17 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_socketio import SocketIO
 
+try:
+    import orjson
+    # JSON columns (game questions, player answers) are (de)serialized on every read/write
+    _engine_options = {
+        'json_serializer': lambda obj: orjson.dumps(obj).decode(),
+        'json_deserializer': orjson.loads,
+    }
+except ImportError:
+    _engine_options = {}
+
 # Initialize extensions
-db = SQLAlchemy()
+db = SQLAlchemy(engine_options=_engine_options)
 migrate = Migrate()
 socketio = SocketIO()
\ No newline at end of file
@@ -1,38 +1,121 @@
 # FlaskProject/game_logic.py - Core Game Logic
 
-import json
 import logging
-import random
+import secrets
+import threading
 import time
+from collections import OrderedDict
+from operator import itemgetter
 from pathlib import Path
 
+from sqlalchemy import case, delete, func, insert, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer, raiseload
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from extensions import db, socketio
-from database import Game, Player, User, Achievement, UserAchievement
+from database import Game, Player, PlayerAnswer, User, Achievement, UserAchievement
 
 logger = logging.getLogger(__name__)
 
 # Question data cache
 _question_cache = {}
+_questions_by_difficulty_cache = {}
+# Serializes cache fills so concurrent misses parse each file only once
+_question_cache_lock = threading.RLock()
+
+# Per-game caches hold at most this many games, each for at most this many seconds
+# since last use; abandoned games are never finished and cleanup_old_games isn't scheduled
+GAME_CACHE_MAX_ENTRIES = 512
+GAME_CACHE_TTL = 3 * 60 * 60
+
+class _GameCache:
+    """Thread-safe LRU mapping of game PIN -> (game created_at, value) with a TTL.
+    
+    Values are only returned for the game they were stored for: a PIN reused by a
+    newer game has a different created_at and misses.
+    """
+    
+    def __init__(self, max_entries=GAME_CACHE_MAX_ENTRIES, ttl=GAME_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # pin -> (last used, created_at, value)
+        self._lock = threading.Lock()
+    
+    def get(self, game):
+        """Return the value cached for this game, or None."""
+        with self._lock:
+            entry = self._entries.get(game.pin)
+            if entry is None:
+                return None
+            used_at, created_at, value = entry
+            now = time.monotonic()
+            if created_at != game.created_at or now - used_at > self.ttl:
+                del self._entries[game.pin]
+                return None
+            self._entries[game.pin] = (now, created_at, value)
+            self._entries.move_to_end(game.pin)
+            return value
+    
+    def set(self, pin, created_at, value):
+        with self._lock:
+            self._entries[pin] = (time.monotonic(), created_at, value)
+            self._entries.move_to_end(pin)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def pop(self, pin):
+        with self._lock:
+            self._entries.pop(pin, None)
+    
+    def __contains__(self, pin):
+        with self._lock:
+            return pin in self._entries
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+# Leaderboard cache: (scored question index, ranked player rows)
+_leaderboard_cache = _GameCache()
+# Questions of running games (fixed once the game is created)
+_game_questions_cache = _GameCache()
+# Seconds the active achievements are reused; initialize_default_achievements clears
+# them directly, the TTL picks up achievements changed in the database
+ACHIEVEMENTS_CACHE_TTL = 300
+_active_achievements_cache = None  # (fetched at, rows)
 
 def load_questions(language='de'):
     """Load questions from JSON file with caching."""
     if language in _question_cache:
         return _question_cache[language]
     
+    with _question_cache_lock:
+        if language in _question_cache:
+            return _question_cache[language]
+        return _load_questions_file(language)
+
+def _load_questions_file(language):
+    """Parse and cache a questions file; called with _question_cache_lock held."""
     try:
         questions_file = Path(__file__).parent / f'questions_{language}.json'
         if not questions_file.exists():
             logger.error(f"Questions file not found: {questions_file}")
             return []
         
-        with open(questions_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_loads(questions_file.read_bytes())
         
         # Flatten the questions from all difficulty levels
         all_questions = []
         for difficulty, questions in data.items():
             all_questions.extend(questions)
         
+        # Stored as a tuple so callers can't mutate the shared cache
+        all_questions = tuple(all_questions)
         _question_cache[language] = all_questions
         logger.info(f"Loaded {len(all_questions)} questions for language '{language}'")
         return all_questions
@@ -41,30 +124,90 @@ def load_questions(language='de'):
         logger.error(f"Error loading questions for language '{language}': {e}")
         return []
 
+def load_questions_by_difficulty(language, difficulty):
+    """Load the questions of one difficulty level, partitioned once per language."""
+    if language not in _questions_by_difficulty_cache:
+        with _question_cache_lock:
+            if language not in _questions_by_difficulty_cache:
+                all_questions = load_questions(language)
+                if not all_questions:
+                    return []
+                
+                by_difficulty = {}
+                for question in all_questions:
+                    by_difficulty.setdefault(question.get('difficulty'), []).append(question)
+                _questions_by_difficulty_cache[language] = {
+                    level: tuple(questions) for level, questions in by_difficulty.items()
+                }
+    
+    return _questions_by_difficulty_cache[language].get(difficulty, [])
+
+def preload_questions():
+    """Parse every questions_<language>.json file into the cache."""
+    for questions_file in Path(__file__).parent.glob('questions_*.json'):
+        load_questions(questions_file.stem[len('questions_'):])
+
+# Attempts at inserting a game before giving up on finding a free PIN
+MAX_PIN_ATTEMPTS = 5
+
+def _random_pin():
+    """Return an unpredictable 6-digit PIN (not checked for uniqueness)."""
+    return f"{secrets.randbelow(900000) + 100000}"
+
 def generate_pin():
     """Generate a unique 6-digit game PIN."""
     while True:
-        pin = f"{random.randint(100000, 999999)}"
+        pin = _random_pin()
         if not Game.query.get(pin):
             return pin
 
+def _get_game(pin):
+    """Load a game by PIN for the game flow.
+    
+    raiseload('*') makes any relationship access on it raise instead of issuing a
+    lazy query per game, so an N+1 slipped into these hot paths fails loudly.
+    The questions JSON is deferred; read it through get_game_questions().
+    """
+    return db.session.get(Game, pin, options=[defer(Game.questions), raiseload('*')])
+
+def get_game_questions(game):
+    """Return a game's questions, loaded and parsed once per process."""
+    questions = _game_questions_cache.get(game)
+    if questions is None:
+        questions = game.questions
+        _game_questions_cache.set(game.pin, game.created_at, questions)
+    return questions
+
 def create_new_game(host_name, questions):
-    """Create a new game with the given host and questions."""
+    """Create a new game with the given host and questions.
+    
+    The PIN's primary key constraint detects collisions, so no lookup is needed before inserting.
+    """
     try:
-        pin = generate_pin()
-        
-        new_game = Game(
-            pin=pin,
-            host_name=host_name,
-            questions=questions,
-            state='waiting'
-        )
-        
-        db.session.add(new_game)
-        db.session.commit()
+        for _ in range(MAX_PIN_ATTEMPTS):
+            pin = _random_pin()
+            try:
+                # INSERT ... RETURNING hands back the Game without a unit-of-work flush
+                new_game = db.session.scalars(insert(Game).returning(Game), [{
+                    'pin': pin,
+                    'host_name': host_name,
+                    'questions': questions,
+                    'state': 'waiting'
+                }]).one()
+                # Read before the commit expires it; RETURNING already loaded it
+                created_at = new_game.created_at
+                db.session.commit()
+            except IntegrityError:
+                # PIN already taken, try another one
+                db.session.rollback()
+                continue
+            
+            _game_questions_cache.set(pin, created_at, questions)
+            logger.info(f"Created new game {pin} hosted by {host_name}")
+            return new_game
         
-        logger.info(f"Created new game {pin} hosted by {host_name}")
-        return new_game
+        logger.error(f"Could not find a free game PIN after {MAX_PIN_ATTEMPTS} attempts")
+        return None
         
     except Exception as e:
         logger.error(f"Error creating new game: {e}")
@@ -74,7 +217,7 @@ def create_new_game(host_name, questions):
 def add_player_to_game(pin, player_id, player_name):
     """Add a player to an existing game."""
     try:
-        game = Game.query.get(pin)
+        game = _get_game(pin)
         if not game:
             logger.warning(f"Attempted to join non-existent game: {pin}")
             return None
@@ -83,28 +226,31 @@ def add_player_to_game(pin, player_id, player_name):
             logger.warning(f"Attempted to join game {pin} not in waiting state")
             return None
         
-        # Check if player name already exists in this game
-        existing_player = Player.query.filter_by(game_pin=pin, name=player_name).first()
-        if existing_player:
+        try:
+            new_player = db.session.scalars(insert(Player).returning(Player), [{
+                'id': player_id,
+                'name': player_name,
+                'game_pin': pin
+            }]).one()
+            db.session.commit()
+        except IntegrityError:
+            # The unique (game_pin, name) index rejects duplicate names
+            db.session.rollback()
             logger.warning(f"Player name '{player_name}' already exists in game {pin}")
             return None
         
-        new_player = Player(
-            id=player_id,
-            name=player_name,
-            game_pin=pin
+        # Notify all players in the game room about the new player. Only the new
+        # player is sent; the lobby page renders the players who joined before it
+        player_count = db.session.scalar(
+            select(func.count()).select_from(Player).where(Player.game_pin == pin)
         )
-        
-        db.session.add(new_player)
-        db.session.commit()
-        
-        # Notify all players in the game room about the new player
-        players_list = [{'id': p.id, 'name': p.name} for p in game.players.all()]
-        socketio.emit('player_joined', {
+        # The broadcast runs in a background task so the join request doesn't
+        # wait for the fan-out to every client in the room
+        socketio.start_background_task(socketio.emit, 'player_joined', {
+            'player': {'id': player_id, 'name': player_name},
             'player_name': player_name,
-            'total_players': game.players.count(),
-            'players': players_list,
-            'player_count': game.players.count()
+            'total_players': player_count,
+            'player_count': player_count
         }, room=pin)
         
         logger.info(f"Player '{player_name}' joined game {pin}")
@@ -118,14 +264,14 @@ def add_player_to_game(pin, player_id, player_name):
 def start_question(pin):
     """Start the current question for a game."""
     try:
-        game = Game.query.get(pin)
+        game = _get_game(pin)
         if not game:
             return None
             
         if game.state == 'waiting':
             game.state = 'playing'
         
-        if game.current_question >= len(game.questions):
+        if game.current_question >= len(get_game_questions(game)):
             logger.warning(f"No more questions for game {pin}")
             return None
         
@@ -141,41 +287,39 @@ def start_question(pin):
 def submit_answer(pin, player_id, answer, response_time):
     """Submit an answer for a player."""
     try:
-        player = Player.query.get(player_id)
-        if not player or player.game_pin != pin:
+        # One round trip for the player and the game's progress; the game's
+        # questions JSON is not needed here, so it isn't loaded and parsed.
+        # lambda_stmt builds the statement once and only rebinds the closure
+        # values on later calls, as this runs for every answer
+        row = db.session.execute(lambda_stmt(
+            lambda: select(Player.name, Game.state, Game.current_question)
+            .join(Game, Player.game_pin == Game.pin)
+            .where(Player.id == player_id, Player.game_pin == pin)
+        )).one_or_none()
+        if row is None:
             logger.warning(f"Invalid player {player_id} for game {pin}")
             return False
         
-        game = Game.query.get(pin)
-        if not game or game.state != 'playing':
+        player_name, state, question_index = row
+        if state != 'playing':
             logger.warning(f"Game {pin} not in playing state")
             return False
         
-        # Check if this question was already answered
-        current_answers = player.answers or []
-        question_index = game.current_question
-        
-        # Ensure answers list is long enough
-        while len(current_answers) <= question_index:
-            current_answers.append(None)
-        
-        # Don't allow re-answering the same question
-        if current_answers[question_index] is not None:
+        try:
+            db.session.execute(insert(PlayerAnswer).values(
+                player_id=player_id,
+                question_index=question_index,
+                answer=str(answer),
+                response_time=response_time
+            ))
+            db.session.commit()
+        except IntegrityError:
+            # The (player_id, question_index) primary key rejects re-answering
+            db.session.rollback()
             logger.warning(f"Player {player_id} already answered question {question_index}")
             return False
         
-        # Store the answer with metadata
-        answer_data = {
-            'answer': answer,
-            'response_time': response_time,
-            'timestamp': time.time()
-        }
-        current_answers[question_index] = answer_data
-        player.answers = current_answers
-        
-        db.session.commit()
-        
-        logger.info(f"Player {player.name} submitted answer for question {question_index + 1} in game {pin}")
+        logger.info(f"Player {player_name} submitted answer for question {question_index + 1} in game {pin}")
         return True
         
     except Exception as e:
@@ -183,50 +327,66 @@ def submit_answer(pin, player_id, answer, response_time):
         db.session.rollback()
         return False
 
+# Score multiplier per question difficulty
+DIFFICULTY_MULTIPLIERS = {'easy': 1.0, 'medium': 1.2, 'hard': 1.5, 'heavy': 2.0}
+
 def calculate_scores_for_question(pin):
     """Enhanced score calculation with timer and achievement support."""
     try:
-        game = Game.query.get(pin)
+        game = _get_game(pin)
         if not game:
             return None
         
-        current_question = game.questions[game.current_question]
+        # Everything that depends only on the question is worked out once, not per player
+        question_index = game.current_question
+        created_at = game.created_at
+        current_question = get_game_questions(game)[question_index]
         correct_answer = str(current_question['answer']).strip().lower()
         question_timer = current_question.get('timer_seconds', 30)
         base_points = current_question.get('points', 100)
-        
-        for player in game.players:
-            answers = player.answers or []
-            if len(answers) > game.current_question:
-                answer_data = answers[game.current_question]
-                if answer_data and answer_data['answer']:
-                    player_answer = str(answer_data['answer']).strip().lower()
-                    response_time = answer_data.get('response_time', question_timer)
-                    
-                    if player_answer == correct_answer:
-                        # Enhanced scoring system
-                        time_percentage = max(0, (question_timer - response_time) / question_timer)
-                        time_bonus = int(base_points * 0.5 * time_percentage)  # Up to 50% bonus for speed
-                        difficulty_multiplier = {
-                            'easy': 1.0, 'medium': 1.2, 'hard': 1.5, 'heavy': 2.0
-                        }.get(current_question.get('difficulty', 'medium'), 1.0)
-                        
-                        final_score = int((base_points + time_bonus) * difficulty_multiplier)
-                        player.score += final_score
-                        
-                        # Track streak for achievements
-                        if not hasattr(player, 'current_streak'):
-                            player.current_streak = 0
-                        player.current_streak += 1
-                        
-                        logger.info(f"Player {player.name} scored {final_score} points (base: {base_points}, time bonus: {time_bonus}, multiplier: {difficulty_multiplier})")
-                    else:
-                        # Reset streak on wrong answer
-                        if hasattr(player, 'current_streak'):
-                            player.current_streak = 0
-        
+        difficulty_multiplier = DIFFICULTY_MULTIPLIERS.get(current_question.get('difficulty', 'medium'), 1.0)
+        max_time_bonus = base_points * 0.5  # Up to 50% bonus for speed
+        
+        answers = db.session.execute(
+            select(PlayerAnswer.player_id, PlayerAnswer.answer, PlayerAnswer.response_time)
+            .join(Player, PlayerAnswer.player_id == Player.id)
+            .where(Player.game_pin == pin, PlayerAnswer.question_index == question_index)
+        ).all()
+        answers_by_player = {row.player_id: row for row in answers}
+        
+        players = db.session.execute(
+            select(Player.id, Player.name, Player.score).where(Player.game_pin == pin)
+        ).all()
+        
+        # Points per player, written back with a single UPDATE
+        score_deltas = {}
+        for player in players:
+            answer_data = answers_by_player.get(player.id)
+            if answer_data and answer_data.answer and answer_data.answer.strip().lower() == correct_answer:
+                response_time = answer_data.response_time
+                if response_time is None:
+                    response_time = question_timer
+                
+                # Enhanced scoring system
+                time_percentage = max(0, (question_timer - response_time) / question_timer)
+                time_bonus = int(max_time_bonus * time_percentage)
+                
+                final_score = int((base_points + time_bonus) * difficulty_multiplier)
+                score_deltas[player.id] = final_score
+                
+                logger.info(f"Player {player.name} scored {final_score} points (base: {base_points}, time bonus: {time_bonus}, multiplier: {difficulty_multiplier})")
+        
+        if score_deltas:
+            db.session.execute(
+                update(Player)
+                .where(Player.id.in_(score_deltas))
+                .values(score=Player.score + case(score_deltas, value=Player.id, else_=0)),
+                execution_options={'synchronize_session': False}
+            )
         db.session.commit()
-        logger.info(f"Calculated scores for question {game.current_question + 1} in game {pin}")
+        # Scores only change here, so rank once instead of on every leaderboard read
+        _leaderboard_cache.set(pin, created_at, (question_index, _leaderboard_entries(players, score_deltas)))
+        logger.info(f"Calculated scores for question {question_index + 1} in game {pin}")
         return game
         
     except Exception as e:
@@ -237,14 +397,17 @@ def calculate_scores_for_question(pin):
 def advance_to_next_question(pin):
     """Advance to the next question or finish the game."""
     try:
-        game = Game.query.get(pin)
+        game = _get_game(pin)
         if not game:
             return None
         
         game.current_question += 1
         
-        if game.current_question >= len(game.questions):
+        if game.current_question >= len(get_game_questions(game)):
             game.state = 'finished'
+            # Nothing is scored or asked any more
+            _game_questions_cache.pop(pin)
+            _leaderboard_cache.pop(pin)
             logger.info(f"Game {pin} finished")
         else:
             logger.info(f"Game {pin} advanced to question {game.current_question + 1}")
@@ -258,18 +421,48 @@ def advance_to_next_question(pin):
         return None
 
 def get_leaderboard(pin):
-    """Get the current leaderboard for a game."""
+    """Get the current leaderboard for a game as (id, name, score) rows."""
     try:
-        game = Game.query.get(pin)
-        if not game:
-            return []
-        
-        return game.players.order_by(Player.score.desc()).all()
+        # Unknown PINs simply have no players, no need to load the game first
+        return db.session.execute(
+            select(Player.id, Player.name, Player.score)
+            .where(Player.game_pin == pin)
+            .order_by(Player.score.desc())
+        ).all()
         
     except Exception as e:
         logger.error(f"Error getting leaderboard for game {pin}: {e}")
         return []
 
+def _leaderboard_entries(players, score_deltas=None):
+    """Serialize players as leaderboard rows, highest score first, adding any points not yet reloaded."""
+    score_deltas = score_deltas or {}
+    entries = [{'id': p.id, 'name': p.name, 'score': p.score + score_deltas.get(p.id, 0)} for p in players]
+    entries.sort(key=itemgetter('score'), reverse=True)
+    return entries
+
+def get_game_leaderboard(game):
+    """Get leaderboard rows for a game, reusing the ranking from the last score calculation."""
+    cached = _leaderboard_cache.get(game)
+    if cached and cached[0] == game.current_question:
+        return cached[1]
+    # Finished, not scored in this process or results were skipped: rank the players now
+    return _leaderboard_entries(get_leaderboard(game.pin))
+
+def get_active_achievements():
+    """Return the active achievements as plain rows, cached for ACHIEVEMENTS_CACHE_TTL seconds."""
+    global _active_achievements_cache
+    cached = _active_achievements_cache
+    if cached is None or time.monotonic() - cached[0] > ACHIEVEMENTS_CACHE_TTL:
+        rows = db.session.execute(
+            # Everything result.html shows for an unlocked achievement, plus the requirement
+            select(Achievement.id, Achievement.name, Achievement.description, Achievement.icon,
+                   Achievement.points, Achievement.requirement_type, Achievement.requirement_value)
+            .where(Achievement.is_active.is_(True))
+        ).all()
+        cached = _active_achievements_cache = (time.monotonic(), rows)
+    return cached[1]
+
 def process_achievements(user_id, game_stats=None):
     """Process and unlock achievements for a user."""
     try:
@@ -278,19 +471,17 @@ def process_achievements(user_id, game_stats=None):
             return []
         
         unlocked_achievements = []
-        achievements = Achievement.query.filter_by(is_active=True).all()
-        
-        for achievement in achievements:
-            # Check if user already has this achievement
-            existing = UserAchievement.query.filter_by(
-                user_id=user_id, achievement_id=achievement.id
-            ).first()
-            
-            if existing:
+        new_rows = []
+        # One query for everything the user has already unlocked
+        existing_ids = set(db.session.scalars(
+            select(UserAchievement.achievement_id).where(UserAchievement.user_id == user_id)
+        ))
+        
+        for achievement in get_active_achievements():
+            if achievement.id in existing_ids:
                 continue
                 
             # Check achievement requirements
-            requirement_met = False
             current_value = 0
             
             if achievement.requirement_type == 'total_score':
@@ -305,16 +496,17 @@ def process_achievements(user_id, game_stats=None):
             
             if current_value >= achievement.requirement_value:
                 # Unlock achievement
-                user_achievement = UserAchievement(
-                    user_id=user_id,
-                    achievement_id=achievement.id,
-                    progress=current_value
-                )
-                db.session.add(user_achievement)
+                new_rows.append({
+                    'user_id': user_id,
+                    'achievement_id': achievement.id,
+                    'progress': current_value
+                })
                 unlocked_achievements.append(achievement)
                 
                 logger.info(f"Achievement '{achievement.name}' unlocked for user {user.username}")
         
+        if new_rows:
+            db.session.execute(insert(UserAchievement), new_rows)
         db.session.commit()
         return unlocked_achievements
         
@@ -325,8 +517,9 @@ def process_achievements(user_id, game_stats=None):
 
 def initialize_default_achievements():
     """Create default achievements if they don't exist."""
+    global _active_achievements_cache
     try:
-        if Achievement.query.count() > 0:
+        if db.session.scalar(select(Achievement.id).limit(1)) is not None:
             return  # Already initialized
             
         default_achievements = [
@@ -357,11 +550,10 @@ def initialize_default_achievements():
             }
         ]
         
-        for ach_data in default_achievements:
-            achievement = Achievement(**ach_data)
-            db.session.add(achievement)
-        
+        # ORM bulk INSERT: one batched statement instead of one flush per achievement
+        db.session.execute(insert(Achievement), default_achievements)
         db.session.commit()
+        _active_achievements_cache = None
         logger.info(f"Initialized {len(default_achievements)} default achievements")
         
     except Exception as e:
@@ -398,12 +590,23 @@ def cleanup_old_games():
         from datetime import datetime, timedelta, timezone
         cutoff = datetime.now(timezone.utc) - timedelta(days=1)
         
-        old_games = Game.query.filter(Game.created_at < cutoff).all()
-        for game in old_games:
-            db.session.delete(game)
-        
+        # Bulk DELETEs (children first) instead of loading every game and cascading
+        # through the ORM; SQLite doesn't enforce foreign keys, so no ON DELETE CASCADE
+        bulk = {'synchronize_session': False}
+        old_pins = select(Game.pin).where(Game.created_at < cutoff)
+        old_players = select(Player.id).where(Player.game_pin.in_(old_pins))
+        db.session.execute(delete(PlayerAnswer).where(PlayerAnswer.player_id.in_(old_players)),
+                           execution_options=bulk)
+        db.session.execute(delete(Player).where(Player.game_pin.in_(old_pins)), execution_options=bulk)
+        deleted_pins = db.session.scalars(
+            delete(Game).where(Game.created_at < cutoff).returning(Game.pin), execution_options=bulk
+        ).all()
         db.session.commit()
-        logger.info(f"Cleaned up {len(old_games)} old games")
+        
+        for pin in deleted_pins:
+            _leaderboard_cache.pop(pin)
+            _game_questions_cache.pop(pin)
+        logger.info(f"Cleaned up {len(deleted_pins)} old games")
         
     except Exception as e:
         logger.error(f"Error cleaning up old games: {e}")
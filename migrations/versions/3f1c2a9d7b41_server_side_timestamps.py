@@ -0,0 +1,42 @@
+"""server-side defaults for creation timestamps
+
+Revision ID: 3f1c2a9d7b41
+Revises: 
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d7b41'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = [
+    ('games', 'created_at'),
+    ('players', 'joined_at'),
+    ('player_stats', 'played_at'),
+    ('quiz_sets', 'created_at'),
+]
+
+
+def upgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = CURRENT_TIMESTAMP WHERE {column} IS NULL")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column,
+                                  existing_type=sa.DateTime(),
+                                  server_default=sa.text('CURRENT_TIMESTAMP'),
+                                  nullable=False)
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column,
+                                  existing_type=sa.DateTime(),
+                                  server_default=None,
+                                  nullable=True)
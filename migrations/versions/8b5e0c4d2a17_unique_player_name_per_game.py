@@ -0,0 +1,25 @@
+"""unique player names per game
+
+Revision ID: 8b5e0c4d2a17
+Revises: 3f1c2a9d7b41
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b5e0c4d2a17'
+down_revision = '3f1c2a9d7b41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_players_game_pin_name', 'players', ['game_pin', 'name'], unique=True,
+                    if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_players_game_pin_name', table_name='players')
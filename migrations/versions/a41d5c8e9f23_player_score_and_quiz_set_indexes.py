@@ -0,0 +1,28 @@
+"""indexes for leaderboards and quiz set questions
+
+Revision ID: a41d5c8e9f23
+Revises: e2a6f3b8c915
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41d5c8e9f23'
+down_revision = 'e2a6f3b8c915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_players_game_pin_score', 'players', ['game_pin', 'score'],
+                    if_not_exists=True)
+    op.create_index('ix_custom_questions_quiz_set_id', 'custom_questions', ['quiz_set_id'],
+                    if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_custom_questions_quiz_set_id', table_name='custom_questions')
+    op.drop_index('ix_players_game_pin_score', table_name='players')
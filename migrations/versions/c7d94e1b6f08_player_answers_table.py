@@ -0,0 +1,38 @@
+"""store multiplayer answers in their own table
+
+Revision ID: c7d94e1b6f08
+Revises: 8b5e0c4d2a17
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d94e1b6f08'
+down_revision = '8b5e0c4d2a17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('player_answers',
+                    sa.Column('player_id', sa.String(length=36), nullable=False),
+                    sa.Column('question_index', sa.Integer(), nullable=False),
+                    sa.Column('answer', sa.Text(), nullable=False),
+                    sa.Column('response_time', sa.Float(), nullable=True),
+                    sa.Column('submitted_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'),
+                              nullable=False),
+                    sa.ForeignKeyConstraint(['player_id'], ['players.id']),
+                    sa.PrimaryKeyConstraint('player_id', 'question_index'),
+                    if_not_exists=True)
+    # Answers of running games are not carried over, games only live for a session
+    with op.batch_alter_table('players') as batch_op:
+        batch_op.drop_column('answers')
+
+
+def downgrade():
+    with op.batch_alter_table('players') as batch_op:
+        batch_op.add_column(sa.Column('answers', sa.JSON(), nullable=True))
+    op.drop_table('player_answers')
@@ -0,0 +1,42 @@
+"""server-side defaults for user and achievement timestamps
+
+Revision ID: e2a6f3b8c915
+Revises: c7d94e1b6f08
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a6f3b8c915'
+down_revision = 'c7d94e1b6f08'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'last_active'),
+    ('achievements', 'created_at'),
+    ('user_achievements', 'unlocked_at'),
+]
+
+
+def upgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = CURRENT_TIMESTAMP WHERE {column} IS NULL")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column,
+                                  existing_type=sa.DateTime(),
+                                  server_default=sa.text('CURRENT_TIMESTAMP'),
+                                  nullable=False)
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column,
+                                  existing_type=sa.DateTime(),
+                                  server_default=None,
+                                  nullable=True)
@@ -6,13 +6,38 @@ This script runs various tests and checks to ensure the app is working correctly
 
 import os
 import sys
+import io
 import json
-import logging
+import argparse
+import functools
+import threading
+import concurrent.futures
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads  # C parser; raises a json.JSONDecodeError subclass
+except ImportError:
+    _loads = json.loads
+
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# create_app() initializes shared extensions and the database, so build apps one at a time
+_app_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_app_once():
+    from app import create_app
+    return create_app()
+
+
+def _app():
+    """Return the Flask app shared by all tests, creating it on first use."""
+    with _app_lock:
+        return _create_app_once()
+
 def test_imports():
     """Test that all required modules can be imported."""
     print("🔍 Testing imports...")
@@ -54,11 +79,30 @@ def test_imports():
     
     return True
 
+# Validation results for unchanged question files, keyed by path
+_VALIDATION_CACHE_FILE = Path(__file__).parent / '.pytest_cache' / 'run_tests' / 'questions_valid.json'
+
+def _load_validation_cache():
+    """Load cached question file validation results."""
+    try:
+        return json.loads(_VALIDATION_CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def _save_validation_cache(cache):
+    """Persist question file validation results (best effort)."""
+    try:
+        _VALIDATION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _VALIDATION_CACHE_FILE.write_text(json.dumps(cache), encoding='utf-8')
+    except OSError:
+        pass
+
 def test_question_files():
     """Test that question files exist and are valid JSON."""
     print("📚 Testing question files...")
     
     question_files = ['questions_de.json', 'questions_en.json']
+    cache = _load_validation_cache()
     
     for filename in question_files:
         filepath = Path(filename)
@@ -66,9 +110,18 @@ def test_question_files():
             print(f"❌ Missing question file: {filename}")
             return False
         
+        # Skip re-parsing files that already validated and haven't changed since
+        stat = filepath.stat()
+        cache_key = str(filepath.resolve())
+        fingerprint = [stat.st_mtime_ns, stat.st_size]
+        cached = cache.get(cache_key)
+        if cached and cached.get('fingerprint') == fingerprint:
+            print(f"✅ {filename}: {cached['total_questions']} questions (cached)")
+            continue
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
             
             # Check structure
             required_keys = ['easy', 'medium', 'hard', 'heavy']
@@ -83,6 +136,7 @@ def test_question_files():
                 return False
             
             print(f"✅ {filename}: {total_questions} questions")
+            cache[cache_key] = {'fingerprint': fingerprint, 'total_questions': total_questions}
             
         except json.JSONDecodeError as e:
             print(f"❌ Invalid JSON in {filename}: {e}")
@@ -91,6 +145,7 @@ def test_question_files():
             print(f"❌ Error reading {filename}: {e}")
             return False
     
+    _save_validation_cache(cache)
     return True
 
 def test_app_creation():
@@ -98,8 +153,7 @@ def test_app_creation():
     print("🔧 Testing app creation...")
     
     try:
-        from app import create_app
-        app = create_app()
+        app = _app()
         
         if not app:
             print("❌ App creation returned None")
@@ -142,7 +196,7 @@ def test_network_functions():
         try:
             from utils.network import generate_qr_code
             qr_result = generate_qr_code("http://example.com")
-            if qr_result and qr_result.startswith("data:image/png;base64,"):
+            if qr_result and qr_result.startswith("data:image/svg+xml;base64,"):
                 print("✅ QR code generation working")
             else:
                 print("⚠️  QR code generation might not be working (libraries missing?)")
@@ -206,7 +260,6 @@ def test_game_logic():
     
     try:
         from game_logic import load_questions
-        from app import create_app
         
         # Test question loading
         questions_de = load_questions('de')
@@ -222,7 +275,7 @@ def test_game_logic():
         print(f"✅ Loaded {len(questions_de)} German, {len(questions_en)} English questions")
         
         # Test PIN generation with app context
-        app = create_app()
+        app = _app()
         with app.app_context():
             from game_logic import generate_pin
             pin = generate_pin()
@@ -238,31 +291,173 @@ def test_game_logic():
         print(f"❌ Game logic test failed: {e}")
         return False
 
-def main():
+class _ThreadLocalStdout(io.TextIOBase):
+    """Send print() output to a per-thread buffer so concurrent tests don't interleave."""
+    
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self._local = threading.local()
+    
+    def bind(self, buffer):
+        self._local.buffer = buffer
+    
+    def unbind(self):
+        self._local.buffer = None
+    
+    def write(self, text):
+        target = getattr(self._local, 'buffer', None) or self.fallback
+        return target.write(text)
+    
+    def flush(self):
+        self.fallback.flush()
+
+
+# Application packages next to the top-level modules; virtualenvs, migrations and tests are skipped
+APP_PACKAGES = ('views', 'utils', 'services')
+
+
+def _warm_bytecode_cache():
+    """Precompile the app's modules so the import checks load cached bytecode."""
+    if os.environ.get('CI_NO_WARM') or sys.dont_write_bytecode:
+        return
+    import compileall
+    root = Path(__file__).parent
+    compileall.compile_dir(root, maxlevels=0, quiet=1, workers=0)
+    for package in APP_PACKAGES:
+        compileall.compile_dir(root / package, quiet=1, workers=0)
+
+
+def _safe_run(test_func, stdout):
+    """Run a single test, capturing its output.
+    
+    Returns:
+        Tuple of (test name, passed, captured output)
+    """
+    buffer = io.StringIO()
+    stdout.bind(buffer)
+    try:
+        passed = bool(test_func())
+    except Exception as e:
+        print(f"❌ Test {test_func.__name__} crashed: {e}")
+        passed = False
+    finally:
+        stdout.unbind()
+    return test_func.__name__, passed, buffer.getvalue()
+
+
+ALL_TESTS = [
+    test_imports,
+    test_question_files,
+    test_app_creation,
+    test_network_functions,
+    test_security_functions,
+    test_game_logic
+]
+
+
+# Tests that are pointless to run when another test has failed
+TEST_DEPENDENCIES = {
+    'test_app_creation': ['test_imports'],
+    'test_network_functions': ['test_imports'],
+    'test_security_functions': ['test_imports'],
+    'test_game_logic': ['test_imports', 'test_question_files'],
+}
+
+
+def _select_tests(only):
+    """Select tests whose name (without the test_ prefix) starts with any of the given names."""
+    if not only:
+        return list(ALL_TESTS)
+    return [
+        test_func for test_func in ALL_TESTS
+        if any(test_func.__name__[len('test_'):].startswith(name) for name in only)
+    ]
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the Flask Quiz App checks.")
+    parser.add_argument(
+        '--only', action='append', metavar='NAME',
+        help="Run only the matching checks, e.g. 'network' or 'security' (repeatable)"
+    )
+    parser.add_argument(
+        '--fail-fast', action='store_true',
+        help="Stop after the first batch of checks that contains a failure"
+    )
+    return parser.parse_args(argv)
+
+
+def _run_tests(tests, fail_fast=False):
+    """Run tests in dependency order, running independent tests concurrently.
+    
+    Returns:
+        Dictionary mapping test name to (passed, captured output)
+    """
+    selected = {test_func.__name__ for test_func in tests}
+    results = {}
+    pending = list(tests)
+    
+    # Tests are mostly I/O bound (imports, sockets, file reads), so run each batch concurrently
+    stdout = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        while pending:
+            ready = []
+            for test_func in pending:
+                deps = [dep for dep in TEST_DEPENDENCIES.get(test_func.__name__, []) if dep in selected]
+                failed_deps = [dep for dep in deps if dep in results and not results[dep][0]]
+                if failed_deps:
+                    results[test_func.__name__] = (
+                        False, f"⏭️  Skipped {test_func.__name__}: depends on {', '.join(failed_deps)}\n"
+                    )
+                elif all(dep in results for dep in deps):
+                    ready.append(test_func)
+            pending = [test_func for test_func in pending
+                       if test_func not in ready and test_func.__name__ not in results]
+            
+            if ready:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(ready)) as executor:
+                    for name, test_passed, output in executor.map(
+                            lambda test_func: _safe_run(test_func, stdout), ready):
+                        results[name] = (test_passed, output)
+            
+            if fail_fast and any(not test_passed for test_passed, _ in results.values()):
+                for test_func in pending:
+                    results[test_func.__name__] = (False, f"⏭️  Skipped {test_func.__name__}: --fail-fast\n")
+                break
+    finally:
+        sys.stdout = stdout.fallback
+    
+    return results
+
+
+def main(argv=None):
     """Run all tests."""
+    args = parse_args(argv)
+    
     print("🧠 Flask Quiz App - Test Suite")
     print("=" * 50)
     
-    tests = [
-        test_imports,
-        test_question_files,
-        test_app_creation,
-        test_network_functions,
-        test_security_functions,
-        test_game_logic
-    ]
+    # Only selected tests run, so unrelated modules (Flask app, qrcode, ...) are never imported
+    tests = _select_tests(args.only)
+    if not tests:
+        print(f"❌ No tests match: {', '.join(args.only)}")
+        return False
     
     passed = 0
     total = len(tests)
     
+    _warm_bytecode_cache()
+    results = _run_tests(tests, fail_fast=args.fail_fast)
+    
+    # Print buffered output in the original test order
     for test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-            print()  # Empty line for readability
-        except Exception as e:
-            print(f"❌ Test {test_func.__name__} crashed: {e}")
-            print()
+        test_passed, output = results[test_func.__name__]
+        print(output, end='')
+        print()  # Empty line for readability
+        if test_passed:
+            passed += 1
     
     print("=" * 50)
     print(f"🎯 Test Results: {passed}/{total} tests passed")
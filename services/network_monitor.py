@@ -74,7 +74,7 @@ class NetworkMonitor:
     def _check_network_change(self) -> Dict:
         """Check for network changes and update state."""
         try:
-            new_network_info = get_network_info()
+            new_network_info = get_network_info(use_cache=False)
             new_ip = new_network_info.get('local_ip')
             
             with self._lock:
@@ -154,15 +154,15 @@ class DynamicIPManager:
         """Get current network information."""
         return self.monitor.get_current_network_info()
         
-    def get_network_urls(self, port: int = 5000) -> Dict[str, str]:
-        """Get network URLs using current IP."""
+    def get_network_urls(self, port: int = 5000, include_qr: bool = False) -> Dict[str, str]:
+        """Get network URLs (and optionally QR codes) using current IP."""
         current_ip = self.get_current_ip()
         if not current_ip:
             current_ip = '127.0.0.1'
             
         # Import here to avoid circular imports
         from utils.network import get_network_urls
-        return get_network_urls(host=current_ip, port=port)
+        return get_network_urls(host=current_ip, port=port, include_qr=include_qr)
         
     def _on_ip_change(self, old_ip: str, new_ip: str, network_info: Dict):
         """Handle IP address changes."""
@@ -181,7 +181,8 @@ class DynamicIPManager:
         if self.app:
             with self.app.app_context():
                 port = self.app.config.get('FLASK_PORT', 5000)
-                urls = self.get_network_urls(port)
+                # Include the QR codes so the lobby's codes for the new IP are cached before the next render
+                urls = self.get_network_urls(port, include_qr=True)
                 
                 logger.info(f"Updated network configuration: {network_info}")
                 
@@ -223,6 +224,6 @@ def get_dynamic_network_info() -> Dict:
     """Get current dynamic network information."""
     return network_manager.get_network_info()
 
-def get_dynamic_urls(port: int = 5000) -> Dict[str, str]:
+def get_dynamic_urls(port: int = 5000, include_qr: bool = False) -> Dict[str, str]:
     """Get URLs with current dynamic IP."""
-    return network_manager.get_network_urls(port)
\ No newline at end of file
+    return network_manager.get_network_urls(port, include_qr=include_qr)
\ No newline at end of file
@@ -4,10 +4,11 @@ import logging
 
 from flask import session, request
 from flask_socketio import emit, join_room, leave_room
+from sqlalchemy.orm import defer
 
-from database import Game
+from database import Game, Player
 from extensions import socketio
-from game_logic import submit_answer
+from game_logic import get_game_questions, submit_answer
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +82,7 @@ def handle_join_room(data):
         # Notify other players in the room
         emit('player_connected', {
             'message': f'{player_name} connected to the game',
-            'total_players': game.players.count()
+            'total_players': Player.query.filter_by(game_pin=pin).count()
         }, include_self=False)
         
         logger.info(f"Client {client_id} ({player_name}) successfully joined room {pin}")
@@ -180,7 +181,7 @@ def handle_get_game_status(data):
         return
     
     try:
-        game = Game.query.get(pin)
+        game = Game.query.options(defer(Game.questions)).get(pin)
         if not game:
             emit('error', {'message': 'Game not found'})
             return
@@ -189,8 +190,8 @@ def handle_get_game_status(data):
             'pin': pin,
             'state': game.state,
             'current_question': game.current_question + 1,
-            'total_questions': len(game.questions),
-            'total_players': game.players.count()
+            'total_questions': len(get_game_questions(game)),
+            'total_players': Player.query.filter_by(game_pin=pin).count()
         }
         
         emit('game_status', status)
@@ -1,39 +1,122 @@
 # tests/conftest.py - Test Configuration and Fixtures
 
+from contextlib import contextmanager
+
 import pytest
-import tempfile
-import os
-from pathlib import Path
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
 
 from app import create_app
 from extensions import db
 from database import Game, Player, PlayerStats, QuizSet, CustomQuestion
 
 
-@pytest.fixture
-def app():
-    """Create and configure a new app instance for each test."""
-    # Create a temporary file for the test database
-    db_fd, db_path = tempfile.mkstemp()
+class _TestSession(Session):
+    """Session that honors an explicit bind so each test can join an outer transaction."""
     
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.bind is not None:
+            return self.bind
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+# Issued by the per-test transaction and savepoints, not by the code under test
+_TRANSACTION_STATEMENTS = ('BEGIN', 'SAVEPOINT', 'RELEASE', 'ROLLBACK', 'COMMIT')
+
+
+@contextmanager
+def _record_queries(engine):
+    """Collect the SQL statements executed on the engine inside the block."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_TRANSACTION_STATEMENTS):
+            statements.append(statement)
+    
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def pytest_configure(config):
+    """Skip benchmarks unless asked for with --benchmark-only or --benchmark-enable."""
+    if config.pluginmanager.hasplugin('benchmark') and not config.getoption('benchmark_enable'):
+        config.option.benchmark_skip = True
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep tests marked serial on one xdist worker (needs --dist=loadgroup)."""
+    if not config.pluginmanager.hasplugin('xdist'):
+        return
+    for item in items:
+        if item.get_closest_marker('serial'):
+            item.add_marker(pytest.mark.xdist_group('serial'))
+
+
+@pytest.fixture(scope="session")
+def _app():
+    """Create the app and database schema once per test session."""
     app = create_app('testing')
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
-    app.config['WTF_CSRF_ENABLED'] = False
-    app.config['TESTING'] = True
     
     with app.app_context():
-        db.create_all()
-        yield app
+        engine = db.engine
+        raw_connection = engine.raw_connection()
+        try:
+            # The test database is throwaway, so skip journaling and fsyncs
+            for pragma in ('synchronous=OFF', 'journal_mode=MEMORY', 'temp_store=MEMORY'):
+                raw_connection.driver_connection.execute(f'PRAGMA {pragma}')
+            # pysqlite manages BEGIN on its own, which breaks SAVEPOINTs; let SQLAlchemy emit it
+            raw_connection.driver_connection.isolation_level = None
+        finally:
+            raw_connection.close()
+        event.listen(engine, 'begin', lambda connection: connection.exec_driver_sql('BEGIN'))
         
-    # Clean up
-    os.close(db_fd)
-    os.unlink(db_path)
+        db.create_all()
+    
+    return app
+
+
+@pytest.fixture
+def app(_app):
+    """Provide the shared app, rolling back everything a test writes.
+    
+    Each test runs inside one outer transaction. Commits made by the code
+    under test only release SAVEPOINTs, so the teardown rollback discards
+    all fixture rows and changes in a single statement.
+    """
+    with _app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        app_session = db.session
+        db.session = db._make_scoped_session({
+            'class_': _TestSession,
+            'bind': connection,
+            'join_transaction_mode': 'create_savepoint'
+        })
+        try:
+            yield _app
+        finally:
+            db.session.remove()
+            db.session = app_session
+            transaction.rollback()
+            connection.close()
+
+
+@pytest.fixture(scope="class")
+def _client(_app):
+    """A test client shared by all tests in a class."""
+    return _app.test_client()
 
 
 @pytest.fixture
-def client(app):
-    """A test client for the app."""
-    return app.test_client()
+def client(app, _client):
+    """A test client for the app, starting each test with an empty session."""
+    with _client.session_transaction() as sess:
+        sess.clear()
+    return _client
 
 
 @pytest.fixture
@@ -43,8 +126,17 @@ def runner(app):
 
 
 @pytest.fixture
+def count_queries(app):
+    """Context manager collecting executed SQL, to guard against N+1 query regressions.
+    
+    Usage: ``with count_queries() as queries: ...`` then ``assert len(queries) <= 2``.
+    """
+    return lambda: _record_queries(db.engine)
+
+
+@pytest.fixture(scope="session")
 def sample_questions():
-    """Sample questions for testing."""
+    """Sample questions for testing (shared, treat as read-only)."""
     return [
         {
             "question": "What is 2+2?",
@@ -71,67 +163,64 @@ def sample_questions():
 @pytest.fixture
 def sample_game(app, sample_questions):
     """Create a sample game for testing."""
-    with app.app_context():
-        game = Game(
-            pin="123456",
-            host_name="Test Host",
-            questions=sample_questions,
-            state="waiting"
-        )
-        db.session.add(game)
-        db.session.commit()
-        return game
+    game = Game(
+        pin="123456",
+        host_name="Test Host",
+        questions=sample_questions,
+        state="waiting"
+    )
+    db.session.add(game)
+    db.session.commit()
+    return game
 
 
 @pytest.fixture
 def sample_player(app, sample_game):
     """Create a sample player for testing."""
-    with app.app_context():
-        player = Player(
-            id="test-player-1",
-            name="Test Player",
-            game_pin=sample_game.pin
-        )
-        db.session.add(player)
-        db.session.commit()
-        return player
+    player = Player(
+        id="test-player-1",
+        name="Test Player",
+        game_pin=sample_game.pin
+    )
+    db.session.add(player)
+    db.session.commit()
+    return player
 
 
 @pytest.fixture
 def quiz_set(app):
     """Create a sample quiz set for testing."""
-    with app.app_context():
-        quiz_set = QuizSet(
-            name="Test Quiz Set",
-            author="Test Author"
+    quiz_set = QuizSet(
+        name="Test Quiz Set",
+        author="Test Author"
+    )
+    db.session.add(quiz_set)
+    db.session.flush()  # Get the ID
+    
+    # Add some questions to the quiz set
+    questions = [
+        CustomQuestion(
+            question="Test Question 1?",
+            answer="Answer 1",
+            question_type="text",
+            difficulty="easy",
+            quiz_set_id=quiz_set.id
+        ),
+        CustomQuestion(
+            question="Test Question 2?",
+            answer="Answer 2",
+            question_type="mc",
+            options=["Answer 1", "Answer 2", "Answer 3"],
+            difficulty="medium",
+            quiz_set_id=quiz_set.id
         )
-        db.session.add(quiz_set)
-        db.session.flush()  # Get the ID
-        
-        # Add some questions to the quiz set
-        questions = [
-            CustomQuestion(
-                question="Test Question 1?",
-                answer="Answer 1",
-                question_type="text",
-                difficulty="easy",
-                quiz_set_id=quiz_set.id
-            ),
-            CustomQuestion(
-                question="Test Question 2?",
-                answer="Answer 2",
-                question_type="mc",
-                options=["Answer 1", "Answer 2", "Answer 3"],
-                difficulty="medium",
-                quiz_set_id=quiz_set.id
-            )
-        ]
-        
-        for q in questions:
-            db.session.add(q)
-        
-        db.session.commit()
-        return quiz_set
+    ]
+    
+    for q in questions:
+        db.session.add(q)
+    
+    db.session.commit()
+    return quiz_set
 
 
 @pytest.fixture
@@ -1,20 +1,23 @@
 # tests/test_api_routes.py - API Routes Tests
 
 import pytest
-import json
 from extensions import db
-from database import Game, Player
+from database import PlayerAnswer
+
+INVALID_PINS = ('12345', '1234567', 'abcdef', '12345a')
+AUTH_ERROR_CODES = frozenset({400, 403, 404})
 
 
 class TestNetworkInfoAPI:
     """Test network information API."""
     
+    @pytest.mark.serial
     def test_network_info_endpoint(self, client):
         """Test network info endpoint returns valid data."""
         response = client.get('/api/network-info')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'local_ip' in data
         assert data['local_ip']  # Should not be empty
 
@@ -22,27 +25,27 @@ class TestNetworkInfoAPI:
 class TestHostGameControlAPI:
     """Test host game control API endpoints."""
     
-    def test_start_question_unauthorized(self, client, sample_game):
-        """Test starting question without host authorization."""
-        response = client.post(f'/api/host/{sample_game.pin}/start-question')
+    @pytest.mark.parametrize('endpoint', ['start-question', 'show-results', 'next-question'])
+    def test_host_action_unauthorized(self, client, sample_game, endpoint):
+        """Test host actions without host authorization."""
+        response = client.post(f'/api/host/{sample_game.pin}/{endpoint}')
         
         assert response.status_code == 403
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['error'] == 'Unauthorized'
     
     def test_start_question_authorized(self, client, app, sample_game, authenticated_host_session):
         """Test starting question with host authorization."""
-        with app.app_context():
-            response = client.post(f'/api/host/{sample_game.pin}/start-question')
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data['success'] is True
-            assert 'question_number' in data
-            
-            # Check game state changed
-            game = Game.query.get(sample_game.pin)
-            assert game.state == 'playing'
+        response = client.post(f'/api/host/{sample_game.pin}/start-question')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+        assert 'question_number' in data
+        
+        # Check game state changed
+        db.session.refresh(sample_game)
+        assert sample_game.state == 'playing'
     
     def test_start_question_nonexistent_game(self, client, authenticated_host_session):
         """Test starting question for non-existent game."""
@@ -52,74 +55,55 @@ class TestHostGameControlAPI:
         response = client.post('/api/host/999999/start-question')
         
         assert response.status_code == 404
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
-    def test_show_results_unauthorized(self, client, sample_game):
-        """Test showing results without authorization."""
-        response = client.post(f'/api/host/{sample_game.pin}/show-results')
-        
-        assert response.status_code == 403
-        data = json.loads(response.data)
-        assert data['error'] == 'Unauthorized'
-    
     def test_show_results_authorized(self, client, app, sample_game, sample_player, authenticated_host_session):
         """Test showing results with authorization."""
-        with app.app_context():
-            # Set up game state
-            sample_game.state = 'playing'
-            sample_player.answers = [{'answer': '4', 'response_time': 5.0}]
-            db.session.commit()
-            
-            response = client.post(f'/api/host/{sample_game.pin}/show-results')
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data['success'] is True
-            assert 'correct_answer' in data
-            assert 'leaderboard_count' in data
-    
-    def test_next_question_unauthorized(self, client, sample_game):
-        """Test advancing to next question without authorization."""
-        response = client.post(f'/api/host/{sample_game.pin}/next-question')
+        # Set up game state
+        sample_game.state = 'playing'
+        db.session.add(PlayerAnswer(player_id=sample_player.id, question_index=0, answer='4', response_time=5.0))
+        db.session.commit()
         
-        assert response.status_code == 403
-        data = json.loads(response.data)
-        assert data['error'] == 'Unauthorized'
+        response = client.post(f'/api/host/{sample_game.pin}/show-results')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+        assert 'correct_answer' in data
+        assert 'leaderboard_count' in data
     
     def test_next_question_authorized(self, client, app, sample_game, authenticated_host_session):
         """Test advancing to next question with authorization."""
-        with app.app_context():
-            sample_game.state = 'playing'
-            db.session.commit()
-            
-            response = client.post(f'/api/host/{sample_game.pin}/next-question')
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data['success'] is True
-            assert 'state' in data
-            assert 'question_number' in data
-            
-            # Check game advanced
-            game = Game.query.get(sample_game.pin)
-            assert game.current_question == 1
+        sample_game.state = 'playing'
+        db.session.commit()
+        
+        response = client.post(f'/api/host/{sample_game.pin}/next-question')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+        assert 'state' in data
+        assert 'question_number' in data
+        
+        # Check game advanced
+        db.session.refresh(sample_game)
+        assert sample_game.current_question == 1
     
     def test_next_question_finishes_game(self, client, app, sample_game, authenticated_host_session):
         """Test advancing past last question finishes game."""
-        with app.app_context():
-            # Set to last question
-            sample_game.state = 'playing'
-            sample_game.current_question = len(sample_game.questions) - 1
-            db.session.commit()
-            
-            response = client.post(f'/api/host/{sample_game.pin}/next-question')
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data['success'] is True
-            assert data['state'] == 'finished'
-            assert 'final_leaderboard' in data
+        # Set to last question
+        sample_game.state = 'playing'
+        sample_game.current_question = len(sample_game.questions) - 1
+        db.session.commit()
+        
+        response = client.post(f'/api/host/{sample_game.pin}/next-question')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+        assert data['state'] == 'finished'
+        assert 'final_leaderboard' in data
 
 
 class TestAPIErrorHandling:
@@ -133,7 +117,7 @@ class TestAPIErrorHandling:
         response = client.post('/api/host/invalid/start-question')
         
         # Should handle gracefully (might return 403 or 404)
-        assert response.status_code in [403, 404]
+        assert response.status_code in (403, 404)
     
     def test_missing_game_data(self, client, authenticated_host_session):
         """Test API endpoints with missing game data."""
@@ -143,24 +127,22 @@ class TestAPIErrorHandling:
         response = client.post('/api/host/999999/show-results')
         
         assert response.status_code == 404
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
 
 
 class TestAPIValidation:
     """Test API input validation."""
     
-    def test_pin_validation_in_routes(self, client):
+    @pytest.mark.parametrize('pin', INVALID_PINS)
+    def test_pin_validation_in_routes(self, client, pin):
         """Test that routes validate PIN format."""
-        invalid_pins = ['12345', '1234567', 'abcdef', '12345a']
-        
-        for pin in invalid_pins:
-            with client.session_transaction() as sess:
-                sess['host_pin'] = pin
-            
-            response = client.post(f'/api/host/{pin}/start-question')
-            # Should return error for invalid PIN format
-            assert response.status_code in [400, 403, 404]
+        with client.session_transaction() as sess:
+            sess['host_pin'] = pin
+        
+        response = client.post(f'/api/host/{pin}/start-question')
+        # Should return error for invalid PIN format
+        assert response.status_code in AUTH_ERROR_CODES
     
     def test_session_security(self, client, sample_game):
         """Test that session validation works correctly."""
@@ -171,7 +153,7 @@ class TestAPIValidation:
         response = client.post(f'/api/host/{sample_game.pin}/start-question')
         
         assert response.status_code == 403
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['error'] == 'Unauthorized'
 
 
@@ -186,5 +168,5 @@ class TestAPIContentType:
         assert response.content_type == 'application/json'
         
         # Should be valid JSON
-        data = json.loads(response.data)
+        data = response.get_json()
         assert isinstance(data, dict)
\ No newline at end of file
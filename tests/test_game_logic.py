@@ -1,9 +1,15 @@
 # tests/test_game_logic.py - Game Logic Tests
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+import game_logic
 from extensions import db
 from game_logic import (
     load_questions,
+    load_questions_by_difficulty,
     create_new_game,
     add_player_to_game,
     start_question,
@@ -11,9 +17,14 @@ from game_logic import (
     calculate_scores_for_question,
     advance_to_next_question,
     get_leaderboard,
-    generate_pin
+    get_game_leaderboard,
+    generate_pin,
+    get_game_questions,
+    cleanup_old_games,
+    process_achievements,
+    _get_game
 )
-from database import Game, Player
+from database import Achievement, Game, Player, PlayerAnswer, User, UserAchievement
 
 
 class TestLoadQuestions:
@@ -33,10 +44,25 @@ class TestLoadQuestions:
         assert all('question' in q for q in questions)
         assert all('answer' in q for q in questions)
     
+    def test_load_questions_cached_read_only(self):
+        """Test that the cached questions are shared and can't be mutated."""
+        questions = load_questions('de')
+        assert load_questions('de') is questions
+        assert isinstance(questions, tuple)
+        assert isinstance(load_questions_by_difficulty('de', 'easy'), tuple)
+    
     def test_load_questions_invalid_language(self):
         """Test loading with invalid language."""
         questions = load_questions('invalid')
         assert questions == []
+    
+    def test_load_questions_by_difficulty(self):
+        """Test loading the questions of a single difficulty level."""
+        questions = load_questions_by_difficulty('en', 'easy')
+        assert len(questions) > 0
+        assert all(q['difficulty'] == 'easy' for q in questions)
+        assert load_questions_by_difficulty('en', 'unknown') == []
+        assert load_questions_by_difficulty('invalid', 'easy') == []
 
 
 class TestGameCreation:
@@ -44,38 +70,46 @@ class TestGameCreation:
     
     def test_generate_pin(self, app):
         """Test PIN generation."""
-        with app.app_context():
-            pin1 = generate_pin()
-            pin2 = generate_pin()
-            
-            assert len(pin1) == 6
-            assert len(pin2) == 6
-            assert pin1.isdigit()
-            assert pin2.isdigit()
+        pin1 = generate_pin()
+        pin2 = generate_pin()
+        
+        assert len(pin1) == 6
+        assert len(pin2) == 6
+        assert pin1.isdigit()
+        assert pin2.isdigit()
     
     def test_create_new_game(self, app, sample_questions):
         """Test creating a new game."""
-        with app.app_context():
-            game = create_new_game("Test Host", sample_questions)
-            
-            assert game is not None
-            assert game.host_name == "Test Host"
-            assert game.questions == sample_questions
-            assert game.state == "waiting"
-            assert game.current_question == 0
-            
-            # Verify it's in the database
-            db_game = Game.query.get(game.pin)
-            assert db_game is not None
-            assert db_game.host_name == "Test Host"
+        game = create_new_game("Test Host", sample_questions)
+        
+        assert game is not None
+        assert game.host_name == "Test Host"
+        assert game.questions == sample_questions
+        assert game.state == "waiting"
+        assert game.current_question == 0
+        
+        # Verify it's in the database
+        db_game = Game.query.get(game.pin)
+        assert db_game is not None
+        assert db_game.host_name == "Test Host"
+    
+    def test_create_new_game_retries_taken_pin(self, app, sample_game, sample_questions, monkeypatch):
+        """Test that a PIN collision is retried with a new PIN."""
+        pins = iter([sample_game.pin, '654321'])
+        monkeypatch.setattr('game_logic._random_pin', lambda: next(pins))
+        
+        game = create_new_game("Test Host", sample_questions)
+        
+        assert game is not None
+        assert game.pin == '654321'
+        assert Game.query.count() == 2
     
     def test_create_game_empty_questions(self, app):
         """Test creating game with empty questions list."""
-        with app.app_context():
-            game = create_new_game("Test Host", [])
-            
-            assert game is not None
-            assert len(game.questions) == 0
+        game = create_new_game("Test Host", [])
+        
+        assert game is not None
+        assert len(game.questions) == 0
 
 
 class TestPlayerManagement:
@@ -83,39 +117,52 @@ class TestPlayerManagement:
     
     def test_add_player_to_game(self, app, sample_game):
         """Test adding a player to a game."""
-        with app.app_context():
-            player = add_player_to_game(sample_game.pin, "player-123", "Test Player")
-            
-            assert player is not None
-            assert player.name == "Test Player"
-            assert player.game_pin == sample_game.pin
-            assert player.score == 0
-            
-            # Verify it's in the database
-            db_player = Player.query.get("player-123")
-            assert db_player is not None
+        player = add_player_to_game(sample_game.pin, "player-123", "Test Player")
+        
+        assert player is not None
+        assert player.name == "Test Player"
+        assert player.game_pin == sample_game.pin
+        assert player.score == 0
+        
+        # Verify it's in the database
+        db_player = Player.query.get("player-123")
+        assert db_player is not None
+    
+    def test_add_player_emits_new_player(self, app, sample_game, sample_player, count_queries, monkeypatch):
+        """Test that the join notification carries only the new player and the count."""
+        emitted = []
+        monkeypatch.setattr('game_logic.socketio.emit', lambda event, data, **kwargs: emitted.append((event, data)))
+        # Run the broadcast task inline
+        monkeypatch.setattr('game_logic.socketio.start_background_task', lambda target, *args, **kwargs: target(*args, **kwargs))
+        
+        with count_queries() as queries:
+            player = add_player_to_game(sample_game.pin, "player-123", "Second Player")
+        
+        assert player is not None
+        event, data = emitted[0]
+        assert event == 'player_joined'
+        assert data['player'] == {'id': "player-123", 'name': "Second Player"}
+        assert data['total_players'] == data['player_count'] == 2
+        assert len(queries) <= 3  # game, insert, player count
     
     def test_add_player_nonexistent_game(self, app):
         """Test adding player to non-existent game."""
-        with app.app_context():
-            player = add_player_to_game("999999", "player-123", "Test Player")
-            assert player is None
+        player = add_player_to_game("999999", "player-123", "Test Player")
+        assert player is None
     
     def test_add_player_duplicate_name(self, app, sample_game, sample_player):
         """Test adding player with duplicate name."""
-        with app.app_context():
-            # Try to add another player with the same name
-            player = add_player_to_game(sample_game.pin, "player-456", sample_player.name)
-            assert player is None
+        # Try to add another player with the same name
+        player = add_player_to_game(sample_game.pin, "player-456", sample_player.name)
+        assert player is None
     
     def test_add_player_game_not_waiting(self, app, sample_game):
         """Test adding player to game that's not in waiting state."""
-        with app.app_context():
-            sample_game.state = "playing"
-            db.session.commit()
-            
-            player = add_player_to_game(sample_game.pin, "player-123", "Test Player")
-            assert player is None
+        sample_game.state = "playing"
+        db.session.commit()
+        
+        player = add_player_to_game(sample_game.pin, "player-123", "Test Player")
+        assert player is None
 
 
 class TestGameFlow:
@@ -123,105 +170,182 @@ class TestGameFlow:
     
     def test_start_question(self, app, sample_game):
         """Test starting a question."""
-        with app.app_context():
-            game = start_question(sample_game.pin)
-            
-            assert game is not None
-            assert game.state == "playing"
-            assert game.current_question == 0
+        game = start_question(sample_game.pin)
+        
+        assert game is not None
+        assert game.state == "playing"
+        assert game.current_question == 0
+    
+    def test_game_flow_forbids_lazy_loads(self, app, sample_game):
+        """Test that games loaded for the game flow fail loudly instead of lazy-loading."""
+        pin = sample_game.pin
+        db.session.expunge_all()
+        
+        game = _get_game(pin)
+        
+        with pytest.raises(InvalidRequestError):
+            game.players
     
     def test_start_question_nonexistent_game(self, app):
         """Test starting question for non-existent game."""
-        with app.app_context():
-            game = start_question("999999")
-            assert game is None
+        game = start_question("999999")
+        assert game is None
     
     def test_submit_answer(self, app, sample_game, sample_player):
         """Test submitting an answer."""
-        with app.app_context():
-            # Start the question first
-            sample_game.state = "playing"
-            db.session.commit()
-            
-            success = submit_answer(sample_game.pin, sample_player.id, "4", 5.0)
-            
-            assert success is True
-            
-            # Check that answer was stored
-            player = Player.query.get(sample_player.id)
-            assert len(player.answers) > 0
-            assert player.answers[0]['answer'] == "4"
-            assert player.answers[0]['response_time'] == 5.0
+        # Start the question first
+        sample_game.state = "playing"
+        db.session.commit()
+        
+        success = submit_answer(sample_game.pin, sample_player.id, "4", 5.0)
+        
+        assert success is True
+        
+        # Check that answer was stored
+        player = Player.query.get(sample_player.id)
+        assert len(player.answers) > 0
+        assert player.answers[0].answer == "4"
+        assert player.answers[0].response_time == 5.0
     
     def test_submit_answer_twice(self, app, sample_game, sample_player):
         """Test submitting answer twice for same question."""
-        with app.app_context():
-            sample_game.state = "playing"
-            db.session.commit()
-            
-            # Submit first answer
-            success1 = submit_answer(sample_game.pin, sample_player.id, "4", 5.0)
-            assert success1 is True
-            
-            # Try to submit second answer
-            success2 = submit_answer(sample_game.pin, sample_player.id, "5", 3.0)
-            assert success2 is False
+        sample_game.state = "playing"
+        db.session.commit()
+        
+        # Submit first answer
+        success1 = submit_answer(sample_game.pin, sample_player.id, "4", 5.0)
+        assert success1 is True
+        
+        # Try to submit second answer
+        success2 = submit_answer(sample_game.pin, sample_player.id, "5", 3.0)
+        assert success2 is False
     
     def test_calculate_scores_correct_answer(self, app, sample_game, sample_player):
         """Test score calculation for correct answer."""
-        with app.app_context():
-            sample_game.state = "playing"
-            
-            # Submit correct answer
-            sample_player.answers = [{'answer': '4', 'response_time': 5.0}]
-            db.session.commit()
-            
-            game = calculate_scores_for_question(sample_game.pin)
-            
-            assert game is not None
-            
-            # Check score was awarded
-            player = Player.query.get(sample_player.id)
-            assert player.score > 0
+        sample_game.state = "playing"
+        
+        # Submit correct answer
+        db.session.add(PlayerAnswer(player_id=sample_player.id, question_index=0, answer='4', response_time=5.0))
+        db.session.commit()
+        
+        game = calculate_scores_for_question(sample_game.pin)
+        
+        assert game is not None
+        
+        # Check score was awarded
+        player = Player.query.get(sample_player.id)
+        assert player.score > 0
     
     def test_calculate_scores_wrong_answer(self, app, sample_game, sample_player):
         """Test score calculation for wrong answer."""
-        with app.app_context():
-            sample_game.state = "playing"
-            
-            # Submit wrong answer
-            sample_player.answers = [{'answer': '5', 'response_time': 5.0}]
-            db.session.commit()
-            
-            game = calculate_scores_for_question(sample_game.pin)
-            
-            assert game is not None
-            
-            # Check no score was awarded
-            player = Player.query.get(sample_player.id)
-            assert player.score == 0
+        sample_game.state = "playing"
+        
+        # Submit wrong answer
+        db.session.add(PlayerAnswer(player_id=sample_player.id, question_index=0, answer='5', response_time=5.0))
+        db.session.commit()
+        
+        game = calculate_scores_for_question(sample_game.pin)
+        
+        assert game is not None
+        
+        # Check no score was awarded
+        player = Player.query.get(sample_player.id)
+        assert player.score == 0
+    
+    def test_calculate_scores_stores_leaderboard(self, app, sample_game, sample_player, monkeypatch):
+        """Test that score calculation caches the ranked leaderboard."""
+        monkeypatch.setattr('game_logic._leaderboard_cache', game_logic._GameCache())
+        sample_game.state = "playing"
+        other = Player(id="p2", name="Other", game_pin=sample_game.pin, score=500)
+        db.session.add(other)
+        db.session.add(PlayerAnswer(player_id=sample_player.id, question_index=0, answer='4', response_time=5.0))
+        db.session.commit()
+        
+        game = calculate_scores_for_question(sample_game.pin)
+        leaderboard = get_game_leaderboard(game)
+        
+        assert [row['id'] for row in leaderboard] == ["p2", sample_player.id]
+        assert leaderboard[1]['score'] > 0
+        assert leaderboard is get_game_leaderboard(game)
     
     def test_advance_to_next_question(self, app, sample_game):
         """Test advancing to next question."""
-        with app.app_context():
-            game = advance_to_next_question(sample_game.pin)
-            
-            assert game is not None
-            assert game.current_question == 1
-            assert game.state == "playing"
+        sample_game.state = "playing"
+        db.session.commit()
+        
+        game = advance_to_next_question(sample_game.pin)
+        
+        assert game is not None
+        assert game.current_question == 1
+        assert game.state == "playing"
     
     def test_advance_to_finish_game(self, app, sample_game):
         """Test advancing past last question finishes game."""
-        with app.app_context():
-            # Set to last question
-            sample_game.current_question = len(sample_game.questions) - 1
-            db.session.commit()
-            
-            game = advance_to_next_question(sample_game.pin)
-            
-            assert game is not None
-            assert game.current_question == len(sample_game.questions)
-            assert game.state == "finished"
+        # Set to last question
+        sample_game.current_question = len(sample_game.questions) - 1
+        db.session.commit()
+        
+        game = advance_to_next_question(sample_game.pin)
+        
+        assert game is not None
+        assert game.current_question == len(sample_game.questions)
+        assert game.state == "finished"
+    
+    def test_game_questions_cached_until_finished(self, app, sample_game, sample_questions, count_queries, monkeypatch):
+        """Test that the game flow parses a game's questions once and drops them at the end."""
+        monkeypatch.setattr('game_logic._game_questions_cache', game_logic._GameCache())
+        monkeypatch.setattr('game_logic._leaderboard_cache', game_logic._GameCache())
+        start_question(sample_game.pin)
+        
+        with count_queries() as queries:
+            assert get_game_questions(sample_game) == sample_questions
+        assert queries == []
+        
+        sample_game.current_question = len(sample_questions) - 1
+        db.session.commit()
+        advance_to_next_question(sample_game.pin)
+        
+        assert sample_game.pin not in game_logic._game_questions_cache
+        assert sample_game.pin not in game_logic._leaderboard_cache
+
+
+class TestGameCache:
+    """Test the bounded per-game cache."""
+    
+    @staticmethod
+    def game(pin, created_at=datetime(2026, 1, 1)):
+        return Game(pin=pin, created_at=created_at)
+    
+    def test_reused_pin_misses(self):
+        """Test that a newer game with the same PIN doesn't see the old game's value."""
+        cache = game_logic._GameCache()
+        cache.set("111111", datetime(2026, 1, 1), "old questions")
+        
+        assert cache.get(self.game("111111")) == "old questions"
+        assert cache.get(self.game("111111", datetime(2026, 1, 2))) is None
+        assert "111111" not in cache
+    
+    def test_least_recently_used_evicted(self):
+        """Test that the cache never holds more than max_entries games."""
+        cache = game_logic._GameCache(max_entries=2)
+        cache.set("111111", datetime(2026, 1, 1), 1)
+        cache.set("222222", datetime(2026, 1, 1), 2)
+        cache.get(self.game("111111"))
+        cache.set("333333", datetime(2026, 1, 1), 3)
+        
+        assert len(cache) == 2
+        assert "222222" not in cache
+        assert cache.get(self.game("111111")) == 1
+    
+    def test_entries_expire(self, monkeypatch):
+        """Test that entries unused for longer than the TTL are dropped."""
+        now = [1000.0]
+        monkeypatch.setattr(game_logic.time, 'monotonic', lambda: now[0])
+        cache = game_logic._GameCache(ttl=60)
+        cache.set("111111", datetime(2026, 1, 1), 1)
+        
+        now[0] += 61
+        assert cache.get(self.game("111111")) is None
 
 
 class TestLeaderboard:
@@ -229,30 +353,82 @@ class TestLeaderboard:
     
     def test_get_leaderboard_empty(self, app, sample_game):
         """Test getting leaderboard with no players."""
-        with app.app_context():
-            leaderboard = get_leaderboard(sample_game.pin)
-            assert leaderboard == []
+        leaderboard = get_leaderboard(sample_game.pin)
+        assert leaderboard == []
     
-    def test_get_leaderboard_with_players(self, app, sample_game):
+    def test_get_leaderboard_with_players(self, app, sample_game, count_queries):
         """Test getting leaderboard with players."""
-        with app.app_context():
-            # Add multiple players with different scores
-            player1 = Player(id="p1", name="Player 1", game_pin=sample_game.pin, score=100)
-            player2 = Player(id="p2", name="Player 2", game_pin=sample_game.pin, score=200)
-            player3 = Player(id="p3", name="Player 3", game_pin=sample_game.pin, score=150)
-            
-            db.session.add_all([player1, player2, player3])
-            db.session.commit()
-            
+        # Add multiple players with different scores
+        player1 = Player(id="p1", name="Player 1", game_pin=sample_game.pin, score=100)
+        player2 = Player(id="p2", name="Player 2", game_pin=sample_game.pin, score=200)
+        player3 = Player(id="p3", name="Player 3", game_pin=sample_game.pin, score=150)
+        
+        db.session.add_all([player1, player2, player3])
+        db.session.commit()
+        
+        with count_queries() as queries:
             leaderboard = get_leaderboard(sample_game.pin)
-            
-            assert len(leaderboard) == 3
-            assert leaderboard[0].score == 200  # Highest score first
-            assert leaderboard[1].score == 150
-            assert leaderboard[2].score == 100
+            scores = [player.score for player in leaderboard]
+        
+        assert len(leaderboard) == 3
+        assert scores == [200, 150, 100]  # Highest score first
+        assert len(queries) <= 2  # No per-player lazy loads
     
     def test_get_leaderboard_nonexistent_game(self, app):
         """Test getting leaderboard for non-existent game."""
-        with app.app_context():
-            leaderboard = get_leaderboard("999999")
-            assert leaderboard == []
\ No newline at end of file
+        leaderboard = get_leaderboard("999999")
+        assert leaderboard == []
+
+
+class TestCleanup:
+    """Test removal of stale games."""
+    
+    def test_cleanup_old_games(self, app, sample_game, sample_player, sample_questions):
+        """Test that games older than a day are deleted with their players and answers."""
+        old_game = Game(pin="654321", host_name="Old Host", questions=sample_questions,
+                        created_at=datetime.now(timezone.utc) - timedelta(days=2))
+        old_player = Player(id="old-player", name="Old Player", game_pin=old_game.pin)
+        old_player.answers = [PlayerAnswer(question_index=0, answer="4")]
+        db.session.add_all([old_game, old_player])
+        db.session.commit()
+        
+        cleanup_old_games()
+        db.session.expire_all()
+        
+        assert db.session.get(Game, "654321") is None
+        assert db.session.get(Player, "old-player") is None
+        assert PlayerAnswer.query.filter_by(player_id="old-player").count() == 0
+        assert db.session.get(Game, sample_game.pin) is not None
+        assert db.session.get(Player, sample_player.id) is not None
+
+
+class TestAchievements:
+    """Test achievement unlocking."""
+    
+    def test_process_achievements_unlocks_once(self, app, count_queries):
+        """Test that met achievements are unlocked in bulk and never twice."""
+        user = User(username="Achiever", display_name="Achiever", games_played=1)
+        db.session.add(user)
+        db.session.commit()
+        
+        unlocked = process_achievements(user.id)
+        assert [achievement.name for achievement in unlocked] == ["First Steps"]
+        assert UserAchievement.query.filter_by(user_id=user.id).count() == 1
+        
+        with count_queries() as queries:
+            assert process_achievements(user.id) == []
+        assert len(queries) <= 2  # user and unlocked ids; achievements are cached
+    
+    def test_active_achievements_refreshed_after_ttl(self, app, monkeypatch):
+        """Test that a deactivated achievement stops counting once the cache expires."""
+        now = [1000.0]
+        monkeypatch.setattr(game_logic.time, 'monotonic', lambda: now[0])
+        monkeypatch.setattr('game_logic._active_achievements_cache', None)
+        count = len(game_logic.get_active_achievements())
+        
+        Achievement.query.filter_by(name="First Steps").update({'is_active': False})
+        db.session.commit()
+        assert len(game_logic.get_active_achievements()) == count
+        
+        now[0] += game_logic.ACHIEVEMENTS_CACHE_TTL + 1
+        assert len(game_logic.get_active_achievements()) == count - 1
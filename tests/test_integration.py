@@ -11,103 +11,117 @@ class TestFullGameFlow:
     
     def test_complete_multiplayer_game(self, client, app, sample_questions):
         """Test a complete multiplayer game flow."""
-        with app.app_context():
-            # 1. Host creates a game
-            response = client.post('/host/create-game', data={
-                'host_name': 'Test Host',
-                'quiz_source': 'default_de',
-                'max_questions': '3',
-                'difficulty': 'easy'
+        # 1. Host creates a game
+        response = client.post('/host/create-game', data={
+            'host_name': 'Test Host',
+            'quiz_source': 'default_de',
+            'max_questions': '3',
+            'difficulty': 'easy'
+        })
+        
+        # Should redirect to lobby
+        assert response.status_code == 302
+        
+        # Extract game PIN from redirect URL
+        location = response.headers.get('Location')
+        assert '/host/lobby/' in location
+        game_pin = location.split('/host/lobby/')[1]
+        
+        # Verify game was created
+        game = Game.query.get(game_pin)
+        assert game is not None
+        assert game.host_name == 'Test Host'
+        assert game.state == 'waiting'
+        
+        # 2. Players join the game
+        for i in range(2):
+            response = client.post('/join', data={
+                'pin': game_pin,
+                'player_name': f'Player {i+1}'
             })
             
-            # Should redirect to lobby
             assert response.status_code == 302
-            
-            # Extract game PIN from redirect URL
-            location = response.headers.get('Location')
-            assert '/host/lobby/' in location
-            game_pin = location.split('/host/lobby/')[1]
-            
-            # Verify game was created
-            game = Game.query.get(game_pin)
-            assert game is not None
-            assert game.host_name == 'Test Host'
-            assert game.state == 'waiting'
-            
-            # 2. Players join the game
-            for i in range(2):
-                response = client.post('/join', data={
-                    'pin': game_pin,
-                    'player_name': f'Player {i+1}'
-                })
-                
-                assert response.status_code == 302
-                assert f'/game/{game_pin}' in response.headers.get('Location')
-            
-            # Verify players joined
-            assert game.players.count() == 2
-            
-            # 3. Host starts the first question
-            with client.session_transaction() as sess:
-                sess['host_pin'] = game_pin
-                sess['is_host'] = True
-            
-            response = client.post(f'/api/host/{game_pin}/start-question')
-            assert response.status_code == 200
-            
-            data = json.loads(response.data)
-            assert data['success'] is True
-            
-            # Verify game state changed
-            game = Game.query.get(game_pin)
-            assert game.state == 'playing'
-            assert game.current_question == 0
-            
-            # 4. Host shows results
-            response = client.post(f'/api/host/{game_pin}/show-results')
-            assert response.status_code == 200
-            
-            data = json.loads(response.data)
-            assert data['success'] is True
-            assert 'correct_answer' in data
-            
-            # 5. Host advances to next question
-            response = client.post(f'/api/host/{game_pin}/next-question')
-            assert response.status_code == 200
-            
-            data = json.loads(response.data)
-            assert data['success'] is True
-            
-            # Verify question advanced
-            game = Game.query.get(game_pin)
-            assert game.current_question == 1
+            assert f'/game/{game_pin}' in response.headers.get('Location')
+        
+        # Verify players joined
+        assert Player.query.filter_by(game_pin=game_pin).count() == 2
+        
+        # 3. Host starts the first question
+        with client.session_transaction() as sess:
+            sess['host_pin'] = game_pin
+            sess['is_host'] = True
+        
+        response = client.post(f'/api/host/{game_pin}/start-question')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['success'] is True
+        
+        # Verify game state changed
+        game = Game.query.get(game_pin)
+        assert game.state == 'playing'
+        assert game.current_question == 0
+        
+        # 4. Host shows results
+        response = client.post(f'/api/host/{game_pin}/show-results')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert 'correct_answer' in data
+        
+        # 5. Host advances to next question
+        response = client.post(f'/api/host/{game_pin}/next-question')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['success'] is True
+        
+        # Verify question advanced
+        game = Game.query.get(game_pin)
+        assert game.current_question == 1
     
     def test_solo_quiz_flow(self, client, app):
         """Test complete solo quiz flow."""
-        with app.app_context():
-            # Start solo quiz
-            response = client.post('/start_quiz', data={
-                'player_name': 'Solo Player',
-                'mode': 'difficulty',
-                'difficulty': 'easy',
-                'language': 'de'
-            })
+        # Start solo quiz
+        response = client.post('/start_quiz', data={
+            'player_name': 'Solo Player',
+            'mode': 'difficulty',
+            'difficulty': 'easy',
+            'language': 'de'
+        })
+        
+        assert response.status_code == 302
+        assert '/quiz' in response.headers.get('Location')
+        
+        # Take the quiz
+        for i in range(3):  # Answer 3 questions
+            response = client.get('/quiz')
+            assert response.status_code == 200
             
+            # Submit an answer
+            response = client.post('/quiz', data={'answer': 'test answer'})
             assert response.status_code == 302
-            assert '/quiz' in response.headers.get('Location')
-            
-            # Take the quiz
-            for i in range(3):  # Answer 3 questions
-                response = client.get('/quiz')
-                assert response.status_code == 200
-                
-                # Submit an answer
-                response = client.post('/quiz', data={'answer': 'test answer'})
-                assert response.status_code == 302
-            
-            # Check results
-            response = client.get('/result')
-            assert response.status_code == 200
+        
+        # Check results
+        response = client.get('/result')
+        assert response.status_code == 200
+    
+    def test_result_shows_unlocked_achievements(self, client, app, monkeypatch):
+        """Test that a newly unlocked achievement is rendered with its icon and points."""
+        monkeypatch.setattr('game_logic._active_achievements_cache', None)
+        with client.session_transaction() as sess:
+            sess['player_name'] = 'Achiever'
+            sess['questions'] = [{'question': 'What is 2+2?', 'answer': '4'}]
+            sess['score'] = 1
+        
+        response = client.get('/result')
+        
+        assert response.status_code == 200
+        page = response.get_data(as_text=True)
+        assert 'First Steps' in page
+        assert '🎯' in page
+        assert '+10 Punkte' in page
 
 
 class TestCustomQuizSetFlow:
@@ -115,49 +129,120 @@ class TestCustomQuizSetFlow:
     
     def test_create_and_use_custom_quiz_set(self, client, app):
         """Test creating custom quiz set and using it in a game."""
-        with app.app_context():
-            # 1. Create a new quiz set
-            response = client.post('/host/editor/new', data={
-                'name': 'My Custom Quiz'
-            })
-            
-            assert response.status_code == 302
-            
-            # Extract quiz set ID
-            location = response.headers.get('Location')
-            quiz_set_id = location.split('/host/editor/')[1]
-            
-            # 2. Add questions to the quiz set
-            questions = [
-                {'question': 'What is 2+2?', 'answer': '4', 'question_type': 'text'},
-                {'question': 'What is 3+3?', 'answer': '6', 'question_type': 'text'}
-            ]
-            
-            for q in questions:
-                response = client.post(f'/host/editor/{quiz_set_id}', data=q)
-                assert response.status_code == 302
-            
-            # Verify questions were added
-            quiz_set = QuizSet.query.get(quiz_set_id)
-            assert quiz_set.questions.count() == 2
-            
-            # 3. Create a game using the custom quiz set
-            response = client.post('/host/create-game', data={
-                'host_name': 'Custom Host',
-                'quiz_source': quiz_set_id,
-                'max_questions': '2'
-            })
-            
+        # 1. Create a new quiz set
+        response = client.post('/host/editor/new', data={
+            'name': 'My Custom Quiz'
+        })
+        
+        assert response.status_code == 302
+        
+        # Extract quiz set ID
+        location = response.headers.get('Location')
+        quiz_set_id = location.split('/host/editor/')[1]
+        
+        # 2. Add questions to the quiz set
+        questions = [
+            {'question': 'What is 2+2?', 'answer': '4', 'question_type': 'text'},
+            {'question': 'What is 3+3?', 'answer': '6', 'question_type': 'text'}
+        ]
+        
+        for q in questions:
+            response = client.post(f'/host/editor/{quiz_set_id}', data=q)
             assert response.status_code == 302
-            
-            # Verify game was created with custom questions
-            location = response.headers.get('Location')
-            game_pin = location.split('/host/lobby/')[1]
-            
-            game = Game.query.get(game_pin)
-            assert game is not None
-            assert len(game.questions) == 2
-            assert game.questions[0]['question'] == 'What is 2+2?'
+        
+        # Verify questions were added
+        quiz_set = QuizSet.query.get(quiz_set_id)
+        assert len(quiz_set.questions) == 2
+        
+        # 3. Create a game using the custom quiz set
+        response = client.post('/host/create-game', data={
+            'host_name': 'Custom Host',
+            'quiz_source': quiz_set_id,
+            'max_questions': '2'
+        })
+        
+        assert response.status_code == 302
+        
+        # Verify game was created with custom questions
+        location = response.headers.get('Location')
+        game_pin = location.split('/host/lobby/')[1]
+        
+        game = Game.query.get(game_pin)
+        assert game is not None
+        assert len(game.questions) == 2
+        # Questions are drawn in random order
+        assert {q['question'] for q in game.questions} == {'What is 2+2?', 'What is 3+3?'}
+
+
+    def test_bulk_add_questions(self, client, app, quiz_set):
+        """Test adding several questions to a quiz set in one request."""
+        response = client.post(f'/host/editor/{quiz_set.id}/bulk', json=[
+            {'question': 'What is 4+4?', 'answer': '8'},
+            {'question': 'Pick a color', 'answer': 'Red', 'question_type': 'mc', 'options': ['Red', 'Blue']}
+        ])
+        
+        assert response.status_code == 201
+        assert response.get_json()['added'] == 2
+        assert CustomQuestion.query.filter_by(quiz_set_id=quiz_set.id).count() == 4
+    
+    def test_bulk_add_questions_rejects_invalid_rows(self, client, app, quiz_set):
+        """Test that one invalid question rejects the whole batch."""
+        response = client.post(f'/host/editor/{quiz_set.id}/bulk', json=[
+            {'question': 'What is 4+4?', 'answer': '8'},
+            {'question': 'Pick a color', 'answer': 'Green', 'question_type': 'mc', 'options': ['Red', 'Blue']}
+        ])
+        
+        assert response.status_code == 400
+        assert CustomQuestion.query.filter_by(quiz_set_id=quiz_set.id).count() == 2
+    
+    @pytest.mark.parametrize('row', [
+        {'question': None, 'answer': None},
+        {'question': 42, 'answer': '42'},
+        {'question': 'Pick a letter', 'answer': 'R', 'question_type': 'mc', 'options': 'RGB'},
+        {'question': 'Pick a letter', 'answer': 'R', 'question_type': 'mc', 'options': ['R', 1]},
+        {'question': 'What is 4+4?', 'answer': '8', 'question_type': 'essay'},
+    ])
+    def test_bulk_add_questions_rejects_malformed_json(self, client, app, quiz_set, row):
+        """Test that wrongly typed fields are rejected instead of stringified."""
+        response = client.post(f'/host/editor/{quiz_set.id}/bulk', json=[row])
+        
+        assert response.status_code == 400
+        assert CustomQuestion.query.filter_by(quiz_set_id=quiz_set.id).count() == 2
+    
+    def test_editor_list_refreshes_after_changes(self, client, app, quiz_set, monkeypatch):
+        """Test that the cached editor list is invalidated by editor changes."""
+        monkeypatch.setattr('views.host_routes._quiz_set_list_cache', None)
+        
+        response = client.get('/host/editor')
+        assert response.status_code == 200
+        assert '2 Fragen' in response.get_data(as_text=True)
+        
+        client.post(f'/host/editor/delete_question/{quiz_set.questions[0].id}')
+        
+        response = client.get('/host/editor')
+        assert '1 Fragen' in response.get_data(as_text=True)
+    
+    def test_delete_question(self, client, app, quiz_set):
+        """Test deleting a question redirects back to its quiz set."""
+        question_id = quiz_set.questions[0].id
+        
+        response = client.post(f'/host/editor/delete_question/{question_id}')
+        
+        assert response.status_code == 302
+        assert response.location.endswith(f'/host/editor/{quiz_set.id}')
+        assert CustomQuestion.query.filter_by(quiz_set_id=quiz_set.id).count() == 1
+        assert client.post(f'/host/editor/delete_question/{question_id}').status_code == 404
+    
+    def test_delete_quiz_set_removes_questions(self, client, app, quiz_set):
+        """Test deleting a quiz set also deletes its questions."""
+        set_id = quiz_set.id
+        
+        response = client.post(f'/host/editor/delete_set/{set_id}')
+        
+        assert response.status_code == 302
+        assert db.session.get(QuizSet, set_id) is None
+        assert CustomQuestion.query.filter_by(quiz_set_id=set_id).count() == 0
+        assert client.post(f'/host/editor/delete_set/{set_id}').status_code == 404
 
 
 class TestErrorHandlingIntegration:
@@ -174,13 +259,15 @@ class TestErrorHandlingIntegration:
         assert response.status_code == 302
         # Should redirect back to join page with error
         
-        # Try with invalid PIN format
+        # Try with invalid PIN format: the form is shown again with the error
         response = client.post('/join', data={
             'pin': 'invalid',
             'player_name': 'Test Player'
         })
         
-        assert response.status_code == 302
+        assert response.status_code == 200
+        with client.session_transaction() as sess:
+            assert 'player_id' not in sess
     
     def test_unauthorized_host_actions(self, client, sample_game):
         """Test unauthorized host actions."""
@@ -199,6 +286,15 @@ class TestErrorHandlingIntegration:
             response = client.post(endpoint)
             assert response.status_code == 403
     
+    def test_host_pages_require_game_host(self, client, sample_game, authenticated_host_session):
+        """Test that the host of a game can open its control page."""
+        response = client.get(f'/host/control/{sample_game.pin}')
+        assert response.status_code == 200
+        
+        # Another game's PIN is rejected even when that game does not exist
+        response = client.get('/host/control/999999')
+        assert response.status_code == 302
+    
     def test_invalid_form_submissions(self, client):
         """Test invalid form submissions."""
         # Empty host name
@@ -225,30 +321,30 @@ class TestSecurityIntegration:
     
     def test_xss_protection_in_game_flow(self, client, app):
         """Test XSS protection throughout game flow."""
-        with app.app_context():
-            xss_payload = '<script>alert("XSS")</script>'
-            
-            # Try XSS in player name during game join
-            response = client.post('/join', data={
-                'pin': '123456',  # Invalid game, but tests validation
-                'player_name': xss_payload
-            })
-            
-            # Should handle safely (either reject or escape)
-            assert response.status_code == 302
-            
-            # Try XSS in quiz answers
-            response = client.post('/start_quiz', data={
-                'player_name': 'Safe Player',
-                'mode': 'difficulty',
-                'difficulty': 'easy',
-                'language': 'de'
-            })
-            
-            if response.status_code == 302:  # Quiz started
-                response = client.post('/quiz', data={'answer': xss_payload})
-                # Should handle safely
-                assert response.status_code in [200, 302]
+        xss_payload = '<script>alert("XSS")</script>'
+        
+        # Try XSS in player name during game join
+        response = client.post('/join', data={
+            'pin': '123456',  # Invalid game, but tests validation
+            'player_name': xss_payload
+        })
+        
+        # Rejected by the form (too long) and never echoed unescaped
+        assert response.status_code == 200
+        assert xss_payload not in response.get_data(as_text=True)
+        
+        # Try XSS in quiz answers
+        response = client.post('/start_quiz', data={
+            'player_name': 'Safe Player',
+            'mode': 'difficulty',
+            'difficulty': 'easy',
+            'language': 'de'
+        })
+        
+        if response.status_code == 302:  # Quiz started
+            response = client.post('/quiz', data={'answer': xss_payload})
+            # Should handle safely
+            assert response.status_code in [200, 302]
     
     def test_session_security(self, client, sample_game):
         """Test session security measures."""
@@ -278,35 +374,33 @@ class TestDatabaseIntegrity:
     
     def test_cascading_deletes(self, app, sample_game, sample_player):
         """Test that related records are properly deleted."""
-        with app.app_context():
-            game_pin = sample_game.pin
-            player_id = sample_player.id
-            
-            # Verify records exist
-            assert Game.query.get(game_pin) is not None
-            assert Player.query.get(player_id) is not None
-            
-            # Delete game
-            db.session.delete(sample_game)
-            db.session.commit()
-            
-            # Player should be deleted due to cascade
-            assert Game.query.get(game_pin) is None
-            assert Player.query.get(player_id) is None
+        game_pin = sample_game.pin
+        player_id = sample_player.id
+        
+        # Verify records exist
+        assert Game.query.get(game_pin) is not None
+        assert Player.query.get(player_id) is not None
+        
+        # Delete game
+        db.session.delete(sample_game)
+        db.session.commit()
+        
+        # Player should be deleted due to cascade
+        assert Game.query.get(game_pin) is None
+        assert Player.query.get(player_id) is None
     
     def test_concurrent_game_creation(self, app):
         """Test handling of concurrent game creation."""
-        with app.app_context():
-            # This would need more sophisticated testing in a real scenario
-            # with actual threading, but we can test the basics
-            
-            from game_logic import create_new_game
-            
-            games = []
-            for i in range(5):
-                game = create_new_game(f'Host {i}', [])
-                games.append(game)
-            
-            # All games should have unique PINs
-            pins = [game.pin for game in games]
-            assert len(pins) == len(set(pins))  # All unique
\ No newline at end of file
+        # This would need more sophisticated testing in a real scenario
+        # with actual threading, but we can test the basics
+        
+        from game_logic import create_new_game
+        
+        games = []
+        for i in range(5):
+            game = create_new_game(f'Host {i}', [])
+            games.append(game)
+        
+        # All games should have unique PINs
+        pins = [game.pin for game in games]
+        assert len(pins) == len(set(pins))  # All unique
\ No newline at end of file
@@ -0,0 +1,167 @@
+# tests/test_network.py - Network Utility Tests
+
+import socket
+import time
+
+import pytest
+
+from services.network_monitor import DynamicIPManager
+from utils import network
+from utils.network import get_network_info, get_network_urls, get_port_statuses, is_valid_ip
+
+
+class TestIsValidIp:
+    """Test IP address validation."""
+    
+    @pytest.mark.parametrize('ip', ['192.168.1.10', '10.0.0.1', '::1', 'fd00::5'])
+    def test_valid_addresses(self, ip):
+        """Test that IPv4 and IPv6 addresses are accepted."""
+        assert is_valid_ip(ip)
+    
+    @pytest.mark.parametrize('ip', ['', '256.1.1.1', '192.168.1', 'localhost', 'fd00::5::1', None, 42])
+    def test_invalid_addresses(self, ip):
+        """Test that malformed addresses and non-strings are rejected."""
+        assert not is_valid_ip(ip)
+
+
+class TestNetworkInfo:
+    """Test local IP detection and its overrides."""
+    
+    @pytest.fixture(autouse=True)
+    def detections(self, monkeypatch):
+        """Replace the real detection with a counter and start with an empty cache."""
+        calls = []
+        
+        def detect(prefer_method):
+            calls.append(prefer_method)
+            return {'local_ip': '192.168.1.10', 'status': 'success', 'method': 'stub'}
+        
+        monkeypatch.delenv('APP_LOCAL_IP', raising=False)
+        monkeypatch.setattr(network, '_network_info_cache', {})
+        monkeypatch.setattr(network, '_detect_network_info', detect)
+        return calls
+    
+    def test_env_override(self, monkeypatch, detections):
+        """Test that a valid APP_LOCAL_IP is used without detecting."""
+        monkeypatch.setenv('APP_LOCAL_IP', '10.1.2.3')
+        
+        info = get_network_info()
+        
+        assert info['local_ip'] == '10.1.2.3'
+        assert info['method'] == 'env'
+        assert detections == []
+    
+    def test_invalid_env_override_ignored(self, monkeypatch, detections):
+        """Test that an invalid APP_LOCAL_IP falls back to detection."""
+        monkeypatch.setenv('APP_LOCAL_IP', 'not-an-ip')
+        
+        assert get_network_info()['local_ip'] == '192.168.1.10'
+        assert detections == ['auto']
+    
+    def test_detection_cached_for_ttl(self, monkeypatch, detections):
+        """Test that a detection is reused until NETWORK_INFO_TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(network.time, 'monotonic', lambda: now[0])
+        
+        get_network_info()
+        now[0] += network.NETWORK_INFO_TTL - 1
+        get_network_info()
+        assert len(detections) == 1
+        
+        now[0] += 2
+        get_network_info()
+        assert len(detections) == 2
+        
+        get_network_info(use_cache=False)
+        assert len(detections) == 3
+
+
+class TestNetworkUrls:
+    """Test building the URLs players use to connect."""
+    
+    def test_ipv4_host(self):
+        """Test URLs for an IPv4 address."""
+        urls = get_network_urls(host='192.168.1.10', port=5000)
+        assert urls['join_url'] == 'http://192.168.1.10:5000/join'
+    
+    def test_ipv6_host_bracketed(self):
+        """Test that IPv6 addresses are bracketed so the port stays separate."""
+        urls = get_network_urls(host='fd00::5', port=5000)
+        assert urls['local_url'] == 'http://[fd00::5]:5000'
+        assert urls['join_url'] == 'http://[fd00::5]:5000/join'
+    
+    def test_env_override_ipv6(self, monkeypatch):
+        """Test that an IPv6 APP_LOCAL_IP produces well-formed URLs."""
+        monkeypatch.setenv('APP_LOCAL_IP', 'fd00::5')
+        
+        assert get_network_urls(port=8080)['host_url'] == 'http://[fd00::5]:8080/host'
+
+
+class TestPortStatuses:
+    """Test checking several ports at once."""
+    
+    @pytest.fixture
+    def open_port(self):
+        """A port with a listening socket on localhost."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(('127.0.0.1', 0))
+            server.listen()
+            yield server.getsockname()[1]
+    
+    @pytest.fixture
+    def closed_port(self):
+        """A localhost port nothing listens on."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind(('127.0.0.1', 0))
+            return probe.getsockname()[1]
+    
+    @pytest.mark.serial
+    def test_open_and_closed_ports(self, open_port, closed_port):
+        """Test that each port is reported with its own status."""
+        statuses = get_port_statuses('127.0.0.1', [open_port, closed_port], timeout=1.0)
+        
+        assert statuses == {open_port: True, closed_port: False}
+    
+    def test_duplicate_ports_checked_once(self, monkeypatch):
+        """Test that a port listed twice is only checked once, keeping the order."""
+        checked = []
+        monkeypatch.setattr(network, 'get_port_status', lambda host, port, timeout: checked.append(port) or True)
+        
+        statuses = get_port_statuses('127.0.0.1', [5000, 8080, 5000])
+        
+        assert list(statuses) == [5000, 8080]
+        assert sorted(checked) == [5000, 8080]
+    
+    def test_no_ports(self):
+        """Test that an empty port list needs no checks."""
+        assert get_port_statuses('127.0.0.1', []) == {}
+    
+    def test_checks_run_concurrently(self, monkeypatch):
+        """Test that the total time is bounded by one timeout, not the sum of them."""
+        def slow_check(host, port, timeout):
+            time.sleep(timeout)
+            return False
+        
+        monkeypatch.setattr(network, 'get_port_status', slow_check)
+        
+        start = time.monotonic()
+        statuses = get_port_statuses('127.0.0.1', range(5000, 5010), timeout=0.2)
+        
+        assert statuses == dict.fromkeys(range(5000, 5010), False)
+        assert time.monotonic() - start < 1.0
+
+
+class TestDynamicIPManager:
+    """Test reacting to a changed local IP."""
+    
+    def test_ip_change_prewarms_qr_codes(self, app, monkeypatch, capsys):
+        """Test that an IP change rebuilds the URLs together with their QR codes."""
+        requested = []
+        manager = DynamicIPManager(app)
+        monkeypatch.setattr(manager, 'get_network_urls',
+                            lambda port, include_qr=False: requested.append(include_qr) or {})
+        monkeypatch.setattr('extensions.socketio.emit', lambda *args, **kwargs: None)
+        
+        manager._on_ip_change('192.168.1.10', '192.168.1.20', {'method': 'stub'})
+        
+        assert requested == [True]
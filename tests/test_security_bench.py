@@ -0,0 +1,37 @@
+# tests/test_security_bench.py - Benchmarks for Hot-Path Validators
+# Run with: pytest tests/test_security_bench.py --benchmark-only
+
+import pytest
+from utils.security import validate_pin, sanitize_answer
+from game_logic import generate_pin
+
+pytest.importorskip('pytest_benchmark')
+
+
+def test_validate_pin_bench(benchmark):
+    """Benchmark PIN validation (runs on every join request)."""
+    assert benchmark(validate_pin, '123456') is True
+
+
+@pytest.mark.parametrize('count', [1_000, 10_000, 100_000])
+def test_validate_pin_batch_bench(benchmark, count):
+    """Benchmark validating a batch of PINs, half of them invalid."""
+    pins = [f'{i:06d}' if i % 2 else f'{i:05d}x' for i in range(count)]
+    
+    results = benchmark(lambda: [validate_pin(pin) for pin in pins])
+    assert sum(results) == count // 2
+
+
+@pytest.mark.parametrize('length', [10, 100, 500])
+def test_sanitize_answer_bench(benchmark, length):
+    """Benchmark sanitizing a batch of 1000 answers of the given length."""
+    answers = [f'<b>{i}</b>'.ljust(length, 'a') for i in range(1000)]
+    
+    results = benchmark(lambda: [sanitize_answer(answer) for answer in answers])
+    assert len(results) == 1000
+
+
+def test_generate_pin_bench(benchmark, app):
+    """Benchmark generating a unique game PIN."""
+    pin = benchmark(generate_pin)
+    assert validate_pin(pin)
@@ -0,0 +1,31 @@
+# tests/test_smoke.py - run_tests.py Checks as pytest Tests
+
+from pathlib import Path
+
+import pytest
+
+import run_tests
+
+PROJECT_ROOT = Path(run_tests.__file__).parent
+
+
+@pytest.fixture(autouse=True)
+def project_root(monkeypatch):
+    """The checks use paths relative to the project root."""
+    monkeypatch.chdir(PROJECT_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def testing_app(monkeypatch, _app):
+    """Run the checks against the in-memory test app instead of building one on the dev database."""
+    monkeypatch.setattr(run_tests, '_app', lambda: _app)
+
+
+@pytest.mark.parametrize('check', [
+    pytest.param(check, id=check.__name__[len('test_'):],
+                 marks=pytest.mark.serial if check is run_tests.test_network_functions else ())
+    for check in run_tests.ALL_TESTS
+])
+def test_smoke(check):
+    """Run a run_tests.py check so pytest --lf/--ff can re-run just the failing ones."""
+    assert check()
@@ -1,29 +1,77 @@
 # FlaskProject/utils/network.py - Network Utilities
 
+import os
 import socket
 import logging
 import io
 import base64
-from typing import Dict, Optional
+import functools
+import ipaddress
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
 
 try:
     import qrcode
-    from PIL import Image
+    import qrcode.image.svg
     QR_AVAILABLE = True
 except ImportError:
     QR_AVAILABLE = False
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-def get_network_info(prefer_method: str = 'auto') -> Dict[str, str]:
+# Seconds a detected network configuration is reused before detecting again
+NETWORK_INFO_TTL = 60
+
+_network_info_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+_network_info_lock = threading.Lock()
+
+
+def get_network_info(prefer_method: str = 'auto', use_cache: bool = True) -> Dict[str, str]:
     """Get network information including local IP address.
     
+    If APP_LOCAL_IP is set to a valid IP, it is returned without any detection.
+    Otherwise successful detections are cached for NETWORK_INFO_TTL seconds,
+    since they involve sockets and possibly subprocesses.
+    
     Args:
         prefer_method: Preferred detection method ('auto', 'remote', 'hostname', 'system')
+        use_cache: Reuse a recent result; pass False to force a fresh detection
     
     Returns:
         Dictionary containing network information
     """
+    env_ip = os.environ.get('APP_LOCAL_IP')
+    if env_ip:
+        if is_valid_ip(env_ip):
+            return {
+                'local_ip': env_ip,
+                'status': 'success',
+                'method': 'env'
+            }
+        logger.warning(f"Ignoring invalid APP_LOCAL_IP: {env_ip}")
+    
+    with _network_info_lock:
+        if use_cache:
+            cached = _network_info_cache.get(prefer_method)
+            if cached and time.monotonic() - cached[0] < NETWORK_INFO_TTL:
+                return dict(cached[1])
+        
+        info = _detect_network_info(prefer_method)
+        if info['status'] == 'success':
+            _network_info_cache[prefer_method] = (time.monotonic(), info)
+        return dict(info)
+
+
+def _detect_network_info(prefer_method: str) -> Dict[str, str]:
+    """Detect network information, trying each method in order of preference."""
     methods = []
     
     if prefer_method == 'auto':
@@ -74,8 +122,8 @@ def get_network_info(prefer_method: str = 'auto') -> Dict[str, str]:
                     }
                     
             elif method == 'system_command':
-                # Method 3: Use system commands
-                result = _detect_ip_via_system_commands()
+                # Method 3: Inspect network interfaces, spawning system commands only as a last resort
+                result = _detect_ip_via_interfaces() or _detect_ip_via_system_commands()
                 if result:
                     return result
                     
@@ -93,6 +141,41 @@ def get_network_info(prefer_method: str = 'auto') -> Dict[str, str]:
         'note': 'Using localhost - external access may not work'
     }
 
+def _detect_ip_via_interfaces() -> Optional[Dict[str, str]]:
+    """Detect a private IP from the network interfaces without spawning processes.
+    
+    Returns:
+        Dictionary with IP info or None if failed
+    """
+    if PSUTIL_AVAILABLE:
+        try:
+            for interface, addresses in psutil.net_if_addrs().items():
+                for address in addresses:
+                    if address.family == socket.AF_INET and _is_private_ip(address.address):
+                        return {
+                            'local_ip': address.address,
+                            'status': 'success',
+                            'method': 'interface_psutil',
+                            'interface': interface
+                        }
+        except Exception as e:
+            logger.warning(f"psutil interface detection failed: {e}")
+    
+    try:
+        addresses = socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET)
+    except socket.error:
+        return None
+    
+    for *_, sockaddr in addresses:
+        if _is_private_ip(sockaddr[0]):
+            return {
+                'local_ip': sockaddr[0],
+                'status': 'success',
+                'method': 'interface_getaddrinfo'
+            }
+    
+    return None
+
 def _detect_ip_via_system_commands() -> Optional[Dict[str, str]]:
     """Detect IP using system-specific commands.
     
@@ -237,7 +320,7 @@ def _is_private_ip(ip: str) -> bool:
         return False
 
 def is_valid_ip(ip: str) -> bool:
-    """Check if the given string is a valid IP address.
+    """Check if the given string is a valid IPv4 or IPv6 address.
     
     Args:
         ip: IP address string to validate
@@ -245,10 +328,12 @@ def is_valid_ip(ip: str) -> bool:
     Returns:
         True if valid IP, False otherwise
     """
+    if not isinstance(ip, str):
+        return False
     try:
-        socket.inet_aton(ip)
+        ipaddress.ip_address(ip)
         return True
-    except socket.error:
+    except ValueError:
         return False
 
 def get_port_status(host: str, port: int, timeout: float = 3.0) -> bool:
@@ -271,6 +356,27 @@ def get_port_status(host: str, port: int, timeout: float = 3.0) -> bool:
         return False
 
 
+def get_port_statuses(host: str, ports: Iterable[int], timeout: float = 3.0) -> Dict[int, bool]:
+    """Check several ports on the given host concurrently.
+    
+    Args:
+        host: Host to check
+        ports: Port numbers to check
+        timeout: Connection timeout in seconds (per port)
+        
+    Returns:
+        Dictionary mapping each port to True if open, False otherwise
+    """
+    ports = list(dict.fromkeys(ports))
+    if not ports:
+        return {}
+    
+    # Each check mostly waits on the network, so the total time is the slowest check rather than the sum
+    with ThreadPoolExecutor(max_workers=min(len(ports), 32)) as executor:
+        results = executor.map(lambda port: get_port_status(host, port, timeout), ports)
+        return dict(zip(ports, results))
+
+
 def generate_qr_code(url: str, size: int = 10) -> str:
     """Generate a QR code for the given URL.
     
@@ -279,61 +385,82 @@ def generate_qr_code(url: str, size: int = 10) -> str:
         size: Size of the QR code (1-40)
         
     Returns:
-        Base64 encoded PNG image data or empty string if QR generation fails
+        Base64 encoded SVG image data or empty string if QR generation fails
     """
     if not QR_AVAILABLE:
         logger.warning("QR code libraries not available")
         return ""
         
     try:
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=size,
-            border=4,
-        )
-        qr.add_data(url)
-        qr.make(fit=True)
-        
-        # Create image
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Convert to base64
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        buffer.seek(0)
-        
-        img_str = base64.b64encode(buffer.getvalue()).decode()
-        return f"data:image/png;base64,{img_str}"
-        
+        return _generate_qr_code_cached(url, size)
     except Exception as e:
         logger.error(f"Failed to generate QR code: {e}")
         return ""
 
 
-def get_network_urls(host: str = None, port: int = 5000) -> Dict[str, str]:
+@functools.lru_cache(maxsize=256)
+def _generate_qr_code_cached(url: str, size: int) -> str:
+    """Encode a URL as a base64 SVG data URI.
+    
+    The server URLs rarely change, so repeated renders are served from the cache.
+    Failures raise instead of returning, so they are never cached.
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=size,
+        border=4,
+        image_factory=qrcode.image.svg.SvgPathFillImage,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+    
+    # Create image (SVG text, scaled by the <img> size, no PNG compression)
+    img = qr.make_image()
+    
+    # Convert to base64
+    buffer = io.BytesIO()
+    img.save(buffer)
+    
+    img_str = base64.b64encode(buffer.getvalue()).decode()
+    return f"data:image/svg+xml;base64,{img_str}"
+
+
+def _url_host(host: str) -> str:
+    """Return host as it goes into a URL; IPv6 addresses need square brackets."""
+    try:
+        if ipaddress.ip_address(host).version == 6:
+            return f'[{host}]'
+    except ValueError:
+        pass  # Hostname or already bracketed
+    return host
+
+
+def get_network_urls(host: str = None, port: int = 5000, include_qr: bool = False) -> Dict[str, str]:
     """Get all relevant URLs for network access.
     
     Args:
         host: Host IP (auto-detected if None)
         port: Port number
+        include_qr: Also add base64 QR codes (only needed by pages that display them)
         
     Returns:
-        Dictionary with various URLs and QR codes
+        Dictionary with various URLs and, if requested, QR codes
     """
     if host is None:
         network_info = get_network_info()
         host = network_info.get('local_ip', '127.0.0.1')
     
+    base_url = f'http://{_url_host(host)}:{port}'
     urls = {
-        'local_url': f'http://{host}:{port}',
-        'join_url': f'http://{host}:{port}/join',
-        'host_url': f'http://{host}:{port}/host',
-        'stats_url': f'http://{host}:{port}/stats'
+        'local_url': base_url,
+        'join_url': f'{base_url}/join',
+        'host_url': f'{base_url}/host',
+        'stats_url': f'{base_url}/stats'
     }
     
-    # Generate QR codes if available
-    if QR_AVAILABLE:
+    # Generate QR codes if requested and available
+    if include_qr and QR_AVAILABLE:
         urls.update({
             'local_qr': generate_qr_code(urls['local_url']),
             'join_qr': generate_qr_code(urls['join_url']),
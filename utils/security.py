@@ -6,9 +6,7 @@ from typing import Optional
 
 def validate_pin(pin: str) -> bool:
     """Validate that PIN is exactly 6 digits."""
-    if not pin:
-        return False
-    return re.match(r'^\d{6}$', pin) is not None
+    return isinstance(pin, str) and len(pin) == 6 and pin.isascii() and pin.isdigit()
 
 def validate_player_name(name: str) -> Optional[str]:
     """Validate and sanitize player name.
@@ -67,27 +65,26 @@ def sanitize_answer(answer: str) -> str:
     
     return answer
 
+# Characters allowed in filenames, as a str.translate table that deletes them
+_SAFE_FILENAME_CHARS = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-_')
+
+# Device names Windows reserves regardless of extension
+_WINDOWS_RESERVED_NAMES = frozenset(
+    ['CON', 'PRN', 'AUX', 'NUL']
+    + [f'COM{i}' for i in range(1, 10)]
+    + [f'LPT{i}' for i in range(1, 10)]
+)
+
 def is_safe_filename(filename: str) -> bool:
     """Check if filename is safe for file operations."""
-    if not filename or not isinstance(filename, str):
-        return False
-    
-    # Check for directory traversal attempts
-    dangerous_patterns = ['..', '/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    
-    for pattern in dangerous_patterns:
-        if pattern in filename:
-            return False
-    
-    # Check length
-    if len(filename) > 255:
+    if not filename or not isinstance(filename, str) or len(filename) > 255:
         return False
     
-    # Must contain only safe characters
-    if not re.match(r'^[a-zA-Z0-9\.\-_]+$', filename):
+    # Must contain only safe characters (deleting them all leaves nothing) and no directory traversal
+    if filename.translate(_SAFE_FILENAME_CHARS) or '..' in filename:
         return False
     
-    return True
+    return filename.split('.', 1)[0].upper() not in _WINDOWS_RESERVED_NAMES
 
 def rate_limit_key(request) -> str:
     """Generate rate limiting key based on IP and user agent."""
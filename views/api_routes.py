@@ -11,7 +11,8 @@ from extensions import socketio
 from game_logic import (
     start_question,
     calculate_scores_for_question,
-    get_leaderboard,
+    get_game_leaderboard,
+    get_game_questions,
     advance_to_next_question
 )
 from utils.network import get_network_info
@@ -107,10 +108,11 @@ def start_question_api(pin):
             return jsonify({'error': 'Game not found or finished'}), 404
 
         # Emit to all players in the game room
+        questions = get_game_questions(game)
         socketio.emit('question_started', {
-            'question': game.questions[game.current_question],
+            'question': questions[game.current_question],
             'question_number': game.current_question + 1,
-            'total_questions': len(game.questions)
+            'total_questions': len(questions)
         }, room=pin)
 
         logger.info(f"Question {game.current_question + 1} started for game {pin}")
@@ -136,15 +138,12 @@ def show_results_api(pin):
             logger.warning(f"Failed to calculate scores for game {pin}")
             return jsonify({'error': 'Game not found'}), 404
 
-        if game.current_question >= len(game.questions):
+        questions = get_game_questions(game)
+        if game.current_question >= len(questions):
             return jsonify({'error': 'Invalid question index'}), 400
 
-        correct_answer = game.questions[game.current_question]['answer']
-        leaderboard_data = get_leaderboard(pin)
-        leaderboard = [
-            {'id': p.id, 'name': p.name, 'score': p.score}
-            for p in leaderboard_data
-        ]
+        correct_answer = questions[game.current_question]['answer']
+        leaderboard = get_game_leaderboard(game)
 
         # Emit results to all players
         socketio.emit('results_shown', {
@@ -183,11 +182,7 @@ def next_question_api(pin):
         }
 
         if game.state == 'finished':
-            leaderboard_data = get_leaderboard(pin)
-            leaderboard = [
-                {'id': p.id, 'name': p.name, 'score': p.score}
-                for p in leaderboard_data
-            ]
+            leaderboard = get_game_leaderboard(game)
 
             socketio.emit('game_finished', {
                 'leaderboard': leaderboard
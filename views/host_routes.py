@@ -1,19 +1,69 @@
 # FlaskProject/views/host_routes.py
 
 import random
+import time
+from functools import wraps
 
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, jsonify, abort, g
+from sqlalchemy import delete, func
+from sqlalchemy.orm import selectinload
 
 from database import db, Game, QuizSet, CustomQuestion
-from game_logic import create_new_game, load_questions
+from game_logic import create_new_game, load_questions, load_questions_by_difficulty
 
 host_bp = Blueprint('host', __name__)
 
+# Seconds the editor list may be served from memory; the editor routes below
+# invalidate it on every change, the TTL covers changes made by other workers
+QUIZ_SET_LIST_TTL = 60
+
+_quiz_set_list_cache = None  # (fetched at, rows)
+
+# Question types the bulk JSON endpoint accepts
+BULK_QUESTION_TYPES = frozenset({'text', 'mc'})
+
+
+def _get_quiz_set_list():
+    """Quiz sets for the editor list, newest first, with their question counts."""
+    global _quiz_set_list_cache
+    cached = _quiz_set_list_cache
+    if cached and time.monotonic() - cached[0] < QUIZ_SET_LIST_TTL:
+        return cached[1]
+
+    rows = (db.session.query(QuizSet.id, QuizSet.name, QuizSet.created_at,
+                             func.count(CustomQuestion.id).label('question_count'))
+            .outerjoin(CustomQuestion, CustomQuestion.quiz_set_id == QuizSet.id)
+            .group_by(QuizSet.id)
+            .order_by(QuizSet.created_at.desc())
+            .all())
+    _quiz_set_list_cache = (time.monotonic(), rows)
+    return rows
+
+
+def _invalidate_quiz_set_list():
+    global _quiz_set_list_cache
+    _quiz_set_list_cache = None
+
+
+def host_required(view):
+    """Only let the host of the game in the URL through, passing the game on as g.game."""
+    @wraps(view)
+    def wrapper(pin, *args, **kwargs):
+        # Checked before loading the game, so requests for other games cost no query
+        if session.get('host_pin') != pin:
+            flash('Keine Berechtigung für dieses Spiel!')
+            return redirect(url_for('host.host_dashboard'))
+        g.game = Game.query.get(pin)
+        if not g.game:
+            flash('Spiel nicht gefunden!')
+            return redirect(url_for('host.host_dashboard'))
+        return view(pin, *args, **kwargs)
+    return wrapper
+
 
 @host_bp.route('/host')
 def host_dashboard():
-    quiz_sets = QuizSet.query.all()
-    return render_template('host/dashboard.html', quiz_sets=quiz_sets)
+    return render_template('host/dashboard.html')
 
 
 @host_bp.route('/host/create-game', methods=['POST'])
@@ -31,31 +81,31 @@ def create_game():
     if quiz_source.startswith('default_'):
         language = quiz_source.split('_')[1]
         difficulty = request.form.get('difficulty', 'easy')
-        all_questions = load_questions(language)
-
         if difficulty != 'mixed':
-            questions = [q for q in all_questions if q.get('difficulty') == difficulty]
+            questions = load_questions_by_difficulty(language, difficulty)
         else:
-            questions = all_questions
+            questions = load_questions(language)
+        questions = random.sample(questions, min(max_questions, len(questions)))
     else:  # Eigenes Quiz-Set laden
         quiz_set_id = int(quiz_source)
-        quiz_set = QuizSet.query.get(quiz_set_id)
-        if quiz_set:
-            set_questions = [{
-                'question': q.question,
-                'answer': q.answer,
-                'options': q.options,
-                'type': q.question_type,
-                'difficulty': q.difficulty
-            } for q in quiz_set.questions]
-            questions = set_questions
+        # Let the database pick the random subset so only the chosen rows are loaded
+        chosen = (CustomQuestion.query
+                  .filter_by(quiz_set_id=quiz_set_id)
+                  .order_by(func.random())
+                  .limit(max_questions))
+        questions = [{
+            'question': q.question,
+            'answer': q.answer,
+            'options': q.options,
+            'type': q.question_type,
+            'difficulty': q.difficulty
+        } for q in chosen]
 
     if not questions:
         flash('Keine Fragen für die Auswahl gefunden!')
         return redirect(url_for('host.host_dashboard'))
 
-    final_questions = random.sample(questions, min(max_questions, len(questions)))
-    new_game = create_new_game(host_name, final_questions)
+    new_game = create_new_game(host_name, questions)
 
     session['host_pin'] = new_game.pin
     session['is_host'] = True
@@ -64,23 +114,17 @@ def create_game():
 
 
 @host_bp.route('/host/lobby/<pin>')
+@host_required
 def host_lobby(pin):
     from utils.network import get_network_urls
     from config import get_config
     
-    game = Game.query.get(pin)
-    if not game:
-        flash('Spiel nicht gefunden!')
-        return redirect(url_for('host.host_dashboard'))
-    if session.get('host_pin') != pin:
-        flash('Keine Berechtigung für dieses Spiel!')
-        return redirect(url_for('host.host_dashboard'))
-    
-    players = game.players.all()  # Konvertiere zu Liste
+    game = g.game
+    players = game.players
     config = get_config()
     
     # Get all network URLs and QR codes
-    network_urls = get_network_urls(port=config.FLASK_PORT)
+    network_urls = get_network_urls(port=config.FLASK_PORT, include_qr=True)
     
     return render_template('host/lobby.html', 
                           game=game, 
@@ -90,21 +134,15 @@ def host_lobby(pin):
 
 
 @host_bp.route('/host/control/<pin>')
+@host_required
 def host_control(pin):
-    game = Game.query.get(pin)
-    if not game:
-        flash('Spiel nicht gefunden!')
-        return redirect(url_for('host.host_dashboard'))
-    if session.get('host_pin') != pin:
-        flash('Keine Berechtigung für dieses Spiel!')
-        return redirect(url_for('host.host_dashboard'))
-    return render_template('host/control.html', game=game, pin=pin)
+    return render_template('host/control.html', game=g.game, pin=pin)
 
 
 # --- NEUE ROUTEN FÜR FRAGEN-EDITOR ---
 @host_bp.route('/host/editor')
 def editor_list():
-    quiz_sets = QuizSet.query.order_by(QuizSet.created_at.desc()).all()
+    quiz_sets = _get_quiz_set_list()
     return render_template('host/editor_list.html', quiz_sets=quiz_sets)
 
 
@@ -119,6 +157,7 @@ def create_quiz_set():
         new_set = QuizSet(name=name, author=session.get('player_name', 'Admin'))
         db.session.add(new_set)
         db.session.commit()
+        _invalidate_quiz_set_list()
         return redirect(url_for('host.edit_quiz_set', set_id=new_set.id))
 
     return render_template('host/editor.html', quiz_set=None, question=None)
@@ -126,7 +165,7 @@ def create_quiz_set():
 
 @host_bp.route('/host/editor/<int:set_id>', methods=['GET', 'POST'])
 def edit_quiz_set(set_id):
-    quiz_set = QuizSet.query.get_or_404(set_id)
+    quiz_set = QuizSet.query.options(selectinload(QuizSet.questions)).get_or_404(set_id)
     if request.method == 'POST':
         question_text = request.form.get('question', '').strip()
         answer_text = request.form.get('answer', '').strip()
@@ -152,23 +191,86 @@ def edit_quiz_set(set_id):
         )
         db.session.add(new_question)
         db.session.commit()
+        _invalidate_quiz_set_list()
         return redirect(url_for('host.edit_quiz_set', set_id=set_id))
 
     return render_template('host/editor.html', quiz_set=quiz_set, question=None)
 
 
+@host_bp.route('/host/editor/<int:set_id>/bulk', methods=['POST'])
+def bulk_add_questions(set_id):
+    """Add a JSON array of questions to a quiz set with a single commit."""
+    QuizSet.query.get_or_404(set_id)
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, list) or not payload:
+        return jsonify({'error': 'Expected a non-empty JSON array of questions'}), 400
+
+    new_questions = []
+    for number, row in enumerate(payload, start=1):
+        if not isinstance(row, dict):
+            return jsonify({'error': f'Question {number}: expected an object'}), 400
+
+        question_text = row.get('question')
+        answer_text = row.get('answer')
+        if not isinstance(question_text, str) or not isinstance(answer_text, str):
+            return jsonify({'error': f'Question {number}: question and answer must be strings'}), 400
+        question_text = question_text.strip()
+        answer_text = answer_text.strip()
+        if not question_text or not answer_text:
+            return jsonify({'error': f'Question {number}: question and answer must not be empty'}), 400
+
+        q_type = row.get('question_type', 'text')
+        if q_type not in BULK_QUESTION_TYPES:
+            return jsonify({'error': f'Question {number}: question_type must be "text" or "mc"'}), 400
+
+        raw_options = row.get('options', [])
+        if not isinstance(raw_options, list) or not all(isinstance(o, str) for o in raw_options):
+            return jsonify({'error': f'Question {number}: options must be a list of strings'}), 400
+
+        options = []
+        if q_type == 'mc':
+            options = [o.strip() for o in raw_options if o.strip()]
+            if answer_text not in options:
+                return jsonify({'error': f'Question {number}: the answer must be one of the options'}), 400
+
+        new_questions.append(CustomQuestion(
+            question=question_text,
+            answer=answer_text,
+            question_type=q_type,
+            options=options,
+            quiz_set_id=set_id
+        ))
+
+    db.session.add_all(new_questions)
+    db.session.commit()
+    _invalidate_quiz_set_list()
+    return jsonify({'success': True, 'added': len(new_questions)}), 201
+
+
 @host_bp.route('/host/editor/delete_question/<int:question_id>', methods=['POST'])
 def delete_question(question_id):
-    question = CustomQuestion.query.get_or_404(question_id)
-    set_id = question.quiz_set_id
-    db.session.delete(question)
+    set_id = db.session.execute(
+        delete(CustomQuestion)
+        .where(CustomQuestion.id == question_id)
+        .returning(CustomQuestion.quiz_set_id)
+    ).scalar_one_or_none()
+    if set_id is None:
+        abort(404)
     db.session.commit()
+    _invalidate_quiz_set_list()
     return redirect(url_for('host.edit_quiz_set', set_id=set_id))
 
 
 @host_bp.route('/host/editor/delete_set/<int:set_id>', methods=['POST'])
 def delete_quiz_set(set_id):
-    quiz_set = QuizSet.query.get_or_404(set_id)
-    db.session.delete(quiz_set)
+    # Bulk deletes bypass the ORM cascade, so the questions are removed explicitly
+    db.session.execute(delete(CustomQuestion).where(CustomQuestion.quiz_set_id == set_id))
+    deleted_id = db.session.execute(
+        delete(QuizSet).where(QuizSet.id == set_id).returning(QuizSet.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
+        db.session.rollback()
+        abort(404)
     db.session.commit()
+    _invalidate_quiz_set_list()
     return redirect(url_for('host.editor_list'))
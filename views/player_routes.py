@@ -7,12 +7,13 @@ import uuid
 
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash
 from flask_wtf import FlaskForm
+from sqlalchemy import func
 from wtforms import StringField, SelectField, RadioField, SubmitField
 from wtforms.validators import DataRequired, Length, Regexp
 
 from config import get_config
 from database import db, Game, Player, PlayerStats, User, Achievement, UserAchievement
-from game_logic import load_questions, add_player_to_game, get_user_or_create_guest, process_achievements
+from game_logic import load_questions, load_questions_by_difficulty, add_player_to_game, get_user_or_create_guest, process_achievements
 from utils.security import validate_pin, validate_player_name, sanitize_answer
 
 logger = logging.getLogger(__name__)
@@ -168,7 +169,7 @@ def join_game():
                 return redirect(url_for('player.join_game'))
 
             # Check player limit
-            if game.players.count() >= config.MAX_PLAYERS_PER_GAME:
+            if Player.query.filter_by(game_pin=game.pin).count() >= config.MAX_PLAYERS_PER_GAME:
                 logger.info(f"Game {pin} has reached maximum player limit")
                 flash('This game is full!', 'warning')
                 return redirect(url_for('player.join_game'))
@@ -246,8 +247,10 @@ def start_quiz():
                 flash(f'Keine Fragen für die Sprache "{language}" gefunden!', 'danger')
                 return redirect(url_for('player.index'))
 
-            questions = [q for q in all_questions if
-                         q.get('difficulty') == difficulty] if mode == 'difficulty' else all_questions
+            if mode == 'difficulty':
+                questions = load_questions_by_difficulty(language, difficulty)
+            else:
+                questions = all_questions
 
             if not questions:
                 flash(f'Keine Fragen für den Schwierigkeitsgrad "{difficulty}" gefunden!', 'warning')
@@ -381,7 +384,7 @@ def result():
         user.correct_answers += score
         user.total_score += total_points
         user.best_streak = max(user.best_streak, best_streak)
-        user.last_active = time.time()
+        user.last_active = func.now()
         
         # Enhanced PlayerStats with new fields
         new_stat = PlayerStats(